@@ -14,6 +14,7 @@ Classifies user's question intent to route the request appropriately:
 This helps optimize the pipeline by skipping expensive operations for non-query intents.
 """
 
+import asyncio
 from typing import Literal, Optional
 import dspy
 from loguru import logger
@@ -25,6 +26,9 @@ from chatbi.agent.prompts.intent_prompt import IntentSignature, AmbiguityDetecti
 
 IntentType = Literal["query", "greeting", "help", "clarification", "unknown"]
 
+# Intents the classifier may return as-is; anything else gets mapped
+_VALID_INTENTS = frozenset({"query", "greeting", "help", "clarification", "unknown"})
+
 
 class IntentClassificationAgent(AgentBase):
     """Agent for classifying user question intent and detecting ambiguity"""
@@ -40,16 +44,19 @@ class IntentClassificationAgent(AgentBase):
         
         # 1. First check broad intent
         try:
+            # dspy predictors block on the LLM call; run them in a worker thread
+            # so the event loop can make progress on other work meanwhile
             classify = dspy.ChainOfThought(IntentSignature)
-            response = classify(question=question, context=context)
+            response = await asyncio.to_thread(
+                classify, question=question, context=context
+            )
             intent = response.intent.lower().strip()
             reasoning = response.reasoning
             
             logger.info(f"[{self.name}]: Classified as '{intent}' ({reasoning})")
             
             # Map standard intents if needed
-            valid_intents = ["query", "greeting", "help", "clarification", "unknown"]
-            if intent not in valid_intents:
+            if intent not in _VALID_INTENTS:
                 # Naive mapping
                 if "query" in intent or "data" in intent:
                     intent = "query"
@@ -59,7 +66,9 @@ class IntentClassificationAgent(AgentBase):
             # 2. If intent is query, check for ambiguity
             if intent == "query":
                 check_ambiguity = dspy.ChainOfThought(AmbiguityDetectionSignature)
-                ambiguity_res = check_ambiguity(question=question)
+                ambiguity_res = await asyncio.to_thread(
+                    check_ambiguity, question=question
+                )
                 
                 # Check if it's strictly True
                 is_ambiguous = str(ambiguity_res.is_ambiguous).lower() == "true"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import hashlib
+import threading
+from collections.abc import AsyncIterator
 from typing import Any, Optional
 
+from cachetools import TTLCache
 from loguru import logger
 
 try:
@@ -22,6 +25,12 @@ class SmartBILangChainOrchestrator:
     - Allow future extension for tools/agents without coupling to current pipeline
     """
 
+    # Dashboard summaries keyed by digest of (model, endpoint, metrics text);
+    # unchanged metric snapshots reuse the last LLM answer
+    _summary_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+    # TTLCache is not thread-safe and the sync path runs in worker threads
+    _summary_lock = threading.Lock()
+
     @staticmethod
     def build_analysis_input(
         question: str,
@@ -46,34 +55,97 @@ class SmartBILangChainOrchestrator:
     ) -> str:
         """
         Optional LangChain inference path for dashboard narrative.
+
         Falls back to deterministic text when provider is unavailable.
         """
         if not llm_cfg or not ChatPromptTemplate or not ChatOpenAI:
             return self._fallback_summary(metrics_text)
 
+        cache_key = self._summary_key(llm_cfg, metrics_text)
+        with self._summary_lock:
+            cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            prompt = ChatPromptTemplate.from_messages(
-                [
-                    (
-                        "system",
-                        "You are a senior loan analytics assistant. Provide concise Chinese executive summary.",
-                    ),
-                    ("human", "{input}"),
-                ]
-            )
-            llm = ChatOpenAI(
-                model=llm_cfg.get("model"),
-                base_url=llm_cfg.get("base_url"),
-                api_key=llm_cfg.get("api_key") or "ollama",
-                temperature=0.2,
-            )
-            chain = prompt | llm
-            resp = chain.invoke({"input": metrics_text})
-            return getattr(resp, "content", None) or self._fallback_summary(metrics_text)
+            resp = self._dashboard_chain(llm_cfg).invoke({"input": metrics_text})
+            content = getattr(resp, "content", None)
+            if not content:
+                return self._fallback_summary(metrics_text)
+            # Only real model output is cached so a provider outage is not pinned
+            with self._summary_lock:
+                self._summary_cache[cache_key] = content
+            return content
         except Exception as e:
             logger.warning(f"LangChain dashboard summary failed: {e}")
             return self._fallback_summary(metrics_text)
 
+    async def summarize_for_dashboard_stream(
+        self,
+        llm_cfg: Optional[dict[str, Any]],
+        metrics_text: str,
+    ) -> AsyncIterator[str]:
+        """
+        Streaming variant of summarize_for_dashboard yielding text chunks.
+
+        Cached and fallback summaries are yielded as a single chunk.
+        """
+        if not llm_cfg or not ChatPromptTemplate or not ChatOpenAI:
+            yield self._fallback_summary(metrics_text)
+            return
+
+        cache_key = self._summary_key(llm_cfg, metrics_text)
+        with self._summary_lock:
+            cached = self._summary_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts: list[str] = []
+        try:
+            async for chunk in self._dashboard_chain(llm_cfg).astream({"input": metrics_text}):
+                text = getattr(chunk, "content", None)
+                if text:
+                    parts.append(text)
+                    yield text
+        except Exception as e:
+            logger.warning(f"LangChain dashboard summary stream failed: {e}")
+            if not parts:
+                yield self._fallback_summary(metrics_text)
+            return
+
+        if parts:
+            with self._summary_lock:
+                self._summary_cache[cache_key] = "".join(parts)
+        else:
+            yield self._fallback_summary(metrics_text)
+
+    @staticmethod
+    def _summary_key(llm_cfg: dict[str, Any], metrics_text: str) -> str:
+        return hashlib.blake2b(
+            f"{llm_cfg.get('model')}|{llm_cfg.get('base_url')}|{metrics_text}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    @staticmethod
+    def _dashboard_chain(llm_cfg: dict[str, Any]):
+        prompt = ChatPromptTemplate.from_messages(
+            [
+                (
+                    "system",
+                    "You are a senior loan analytics assistant. Provide concise Chinese executive summary.",
+                ),
+                ("human", "{input}"),
+            ]
+        )
+        llm = ChatOpenAI(
+            model=llm_cfg.get("model"),
+            base_url=llm_cfg.get("base_url"),
+            api_key=llm_cfg.get("api_key") or "ollama",
+            temperature=0.2,
+        )
+        return prompt | llm
+
     @staticmethod
     def _fallback_summary(metrics_text: str) -> str:
         digest = hashlib.md5(metrics_text.encode("utf-8")).hexdigest()[:8]
@@ -30,6 +30,22 @@ class Cache(ABC):
             Any: The cached value or None if not found
         """
 
+    def mget(self, id: str, fields: list[str]) -> dict[str, Any]:
+        """
+        Get several fields of a cached item at once.
+
+        Implementations backed by a remote store should override this to
+        fetch all fields in a single round trip.
+
+        Args:
+            id: Unique identifier for the cached item
+            fields: The fields to retrieve from the cached item
+
+        Returns:
+            Dict[str, Any]: Mapping of each field to its cached value or None
+        """
+        return {field: self.get(id=id, field=field) for field in fields}
+
     @abstractmethod
     def get_all(self) -> list[dict[str, Any]]:
         """
@@ -51,6 +67,23 @@ class Cache(ABC):
             ttl: Time to live in seconds (optional)
         """
 
+    def set_many(
+        self, id: str, values: dict[str, Any], ttl: Optional[int] = None
+    ) -> None:
+        """
+        Set several fields of a cached item at once.
+
+        Implementations backed by a remote store should override this to
+        write all fields in a single round trip.
+
+        Args:
+            id: Unique identifier for the cached item
+            values: Mapping of field names to the values to cache
+            ttl: Time to live in seconds (optional)
+        """
+        for field, value in values.items():
+            self.set(id=id, field=field, value=value, ttl=ttl)
+
     @abstractmethod
     def has(self, id: str, field: Optional[str] = None) -> bool:
         """
@@ -32,6 +32,22 @@ class MemoryCache(Cache):
 
         return None
 
+    def mget(self, id: str, fields: list[str]) -> dict[str, Any]:
+        """Get several fields of one entry with a single lookup, respecting TTL"""
+        entry = self.cache.get(id)
+        if not entry:
+            return dict.fromkeys(fields)
+
+        expires = self.expiration.get(id)
+        if expires:
+            now = time.time()
+            for field in fields:
+                if field in expires and now > expires[field]:
+                    self._cleanup_expired(id, field)
+            entry = self.cache.get(id, {})
+
+        return {field: entry.get(field) for field in fields}
+
     def has(self, id: str, field: Optional[str] = None) -> bool:
         """Check if a key exists in the cache, respecting TTL"""
         if field is not None:
@@ -113,6 +113,25 @@ class RedisCache(Cache):
             # If not JSON, return the raw value
             return result
 
+    @_with_redis_error_handling
+    def mget(self, id: str, fields: list[str]) -> dict[str, Any]:
+        """Get several fields from Redis with a single MGET"""
+        if not self.redis or not fields:
+            return dict.fromkeys(fields)
+
+        results = self.redis.mget([f"{id}:{field}" for field in fields])
+
+        values = {}
+        for field, result in zip(fields, results):
+            if result is None:
+                values[field] = None
+                continue
+            try:
+                values[field] = json.loads(result)
+            except (json.JSONDecodeError, TypeError):
+                values[field] = result
+        return values
+
     @_with_redis_error_handling
     def get_all(self) -> list[dict[str, Any]]:
         """Get all values from the cache - limited to prevent memory issues"""
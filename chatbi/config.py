@@ -61,9 +61,9 @@ class DatabaseConfig:
     password: str = field(default_factory=lambda: os.getenv("DB_PASSWORD", "12345"))
     pool_min: int = field(default_factory=lambda: int(os.getenv("DB_POOL_MIN", "5")))
     pool_max: int = field(default_factory=lambda: int(os.getenv("DB_POOL_MAX", "20")))
-    pool_size: int = field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "5")))
+    pool_size: int = field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", "20")))
     max_overflow: int = field(
-        default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", "40"))
     )
     pool_timeout: int = field(
         default_factory=lambda: int(os.getenv("DB_POOL_TIMEOUT", "30"))
@@ -71,6 +71,12 @@ class DatabaseConfig:
     pool_recycle: int = field(
         default_factory=lambda: int(os.getenv("DB_POOL_RECYCLE", "1800"))
     )
+    # Set when connecting through pgbouncer in transaction pooling mode:
+    # pgbouncer owns the pool, so the app must not hold connections itself.
+    pgbouncer: bool = field(
+        default_factory=lambda: os.getenv("DB_PGBOUNCER", "False").lower()
+        in ("true", "1", "t")
+    )
 
     @property
     def connection_url(self) -> str:
@@ -287,6 +293,7 @@ class Config:
                 "user": self.database.user,
                 "pool_size": self.database.pool_size,
                 "max_overflow": self.database.max_overflow,
+                "pgbouncer": self.database.pgbouncer,
             },
             "cache": {
                 "type": self.cache.type,
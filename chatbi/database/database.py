@@ -28,6 +28,7 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from chatbi.config import get_config
 from chatbi.exceptions import DatabaseError
@@ -69,17 +70,40 @@ sync_engine = create_engine(
     pool_pre_ping=True,  # Check connection health before use
     pool_recycle=db_config.pool_recycle,  # Recycle connections every 30 minutes
 )
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+# expire_on_commit=False keeps loaded attributes usable after commit, so
+# serialising a just-committed entity does not trigger a reload SELECT
+SyncSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=sync_engine
+)
 
 # Initialize async engine and session factory
-async_engine = create_async_engine(
-    async_connection_url,
-    echo=echo_sql,
-    pool_size=db_config.pool_size,
-    max_overflow=db_config.max_overflow,
-    pool_pre_ping=True,
-    pool_recycle=db_config.pool_recycle,
-)
+async_connect_args: dict[str, Any] = {"server_settings": {"application_name": "chatbi"}}
+if db_config.pgbouncer:
+    # pgbouncer (transaction mode) multiplexes server connections, so keep no
+    # client-side pool and disable prepared statement caching, which does not
+    # survive a backend switch between transactions.
+    async_connect_args["statement_cache_size"] = 0
+    async_connect_args["prepared_statement_cache_size"] = 0
+    async_engine = create_async_engine(
+        async_connection_url,
+        echo=echo_sql,
+        poolclass=NullPool,
+        connect_args=async_connect_args,
+    )
+else:
+    # Long-lived pooled connections; request-scoped sessions check one out
+    # instead of paying connection setup on every request
+    async_engine = create_async_engine(
+        async_connection_url,
+        echo=echo_sql,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=db_config.pool_size,
+        max_overflow=db_config.max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=db_config.pool_recycle,
+        pool_timeout=db_pool_timeout,
+        connect_args=async_connect_args,
+    )
 # Using bind instead of engine parameter for compatibility
 AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
 
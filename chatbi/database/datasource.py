@@ -15,7 +15,13 @@ from sqlalchemy import JSON, Column, Text
 from sqlmodel import Field, Relationship, SQLModel
 
 from chatbi.database.drivers.factory import ConnectionPool
-from chatbi.domain.datasource import ConnectionInfo, DatabaseType, DataSourceStatus
+from chatbi.domain.datasource import (
+    CONNECTION_INFO_BY_TYPE,
+    ConnectionInfo,
+    ConnectionUrl,
+    DatabaseType,
+    DataSourceStatus,
+)
 from chatbi.exceptions import DatabaseError
 
 
@@ -61,10 +67,15 @@ class DataSource(SQLModel, table=True):
         Returns:
             ConnectionInfo: Connection parameters
         """
-        # Create a ConnectionInfo object from the datasource config
-        # This assumes config contains all necessary connection parameters
-        connection_info = ConnectionInfo(**self.config)
-        return connection_info
+        # Pick the connection info model for this datasource type; configs
+        # without a dedicated model can still carry a raw connection URL
+        info_cls = CONNECTION_INFO_BY_TYPE.get(self.type)
+        if info_cls is None:
+            if "connectionUrl" in self.config:
+                info_cls = ConnectionUrl
+            else:
+                raise ValueError(f"Unsupported database type: {self.type}")
+        return info_cls(**self.config)
 
 
 class QueryHistory(SQLModel, table=True):
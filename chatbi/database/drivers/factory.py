@@ -55,8 +55,10 @@ class ConnectionPool:
         "last_cleanup": 0,
     }
 
-    # Connection semaphore for limiting total connections
+    # Connection semaphore for limiting total connections; one slot per live adapter
     _semaphore = asyncio.Semaphore(MAX_CONNECTIONS)
+    # Per-config locks serializing adapter creation
+    _creation_locks: dict[str, asyncio.Lock] = {}
 
     @classmethod
     async def get_connection(
@@ -95,20 +97,44 @@ class ConnectionPool:
         conn_hash = f"{db_type}:{ch}"
 
         # First try to find an existing connection
+        found = await cls._find_live(conn_hash)
+        if found:
+            return found
+
+        # Concurrent callers for the same config (e.g. gathered dashboard
+        # metrics) wait for a single adapter instead of each opening a pool
+        creation_lock = cls._creation_locks.setdefault(conn_hash, asyncio.Lock())
+        async with creation_lock:
+            found = await cls._find_live(conn_hash)
+            if found:
+                return found
+            async with cls._lock:
+                cls._stats["misses"] += 1
+            return await cls._create_connection(db_type, connection_info, conn_hash, timeout)
+
+    @classmethod
+    async def _find_live(cls, conn_hash: str) -> Optional[tuple[UUID, DatabaseAdapter]]:
+        """Return a connected adapter registered for this config hash, if any."""
         async with cls._lock:
-            # Try to reuse existing connection
-            if conn_hash in cls._conn_hashes:
-                for conn_id in cls._conn_hashes[conn_hash]:
-                    adapter = cls._adapters.get(conn_id)
-                    if adapter and adapter.is_connected:
-                        # Update last used time
-                        cls._last_used[conn_id] = time.time()
-                        cls._stats["hits"] += 1
-                        return conn_id, adapter
-
-            cls._stats["misses"] += 1
-
-        # No existing connection, try to acquire a semaphore with timeout
+            for conn_id in cls._conn_hashes.get(conn_hash, ()):
+                adapter = cls._adapters.get(conn_id)
+                if adapter and adapter.is_connected:
+                    # Update last used time
+                    cls._last_used[conn_id] = time.time()
+                    cls._stats["hits"] += 1
+                    return conn_id, adapter
+        return None
+
+    @classmethod
+    async def _create_connection(
+        cls,
+        db_type: DatabaseType,
+        connection_info: ConnectionInfo,
+        conn_hash: str,
+        timeout: float,
+    ) -> tuple[UUID, DatabaseAdapter]:
+        """Open and register a new adapter; the caller holds the config's creation lock."""
+        # Try to acquire a connection slot with timeout
         try:
             # Wait for a connection slot
             async with asyncio.timeout(timeout):
@@ -171,10 +197,9 @@ class ConnectionPool:
             conn_id: Connection ID to release
         """
         if conn_id in cls._adapters:
-            # Just update the last used time, don't close yet
+            # Just update the last used time, don't close yet; the adapter keeps
+            # its slot until _close_connection
             cls._last_used[conn_id] = time.time()
-            # Release the semaphore to allow new connections
-            cls._semaphore.release()
 
     @classmethod
     async def _cleanup_expired(cls):
@@ -236,6 +261,9 @@ class ConnectionPool:
             del cls._adapters[conn_id]
             del cls._last_used[conn_id]
 
+            # Free the adapter's slot for new connections
+            cls._semaphore.release()
+
     @classmethod
     async def close_all_connections(cls):
         """Close all connections in the pool."""
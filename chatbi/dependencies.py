@@ -15,8 +15,10 @@ from contextvars import ContextVar
 from typing import Annotated, Any, AsyncGenerator, Dict, Generic, Optional, Type, TypeVar, Union, cast
 
 from fastapi import Depends, Header, HTTPException, Request, Security, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security.api_key import APIKeyHeader
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
@@ -105,6 +107,73 @@ class RepositoryDependency(Generic[T]):
             sync_session.close()
 
 
+class JsonBody(Generic[T]):
+    """
+    Request body dependency that validates the raw JSON bytes in one pass.
+
+    FastAPI decodes a declared body parameter with json.loads and then lets
+    pydantic walk the resulting dict; validating the bytes directly with a
+    prebuilt TypeAdapter skips the intermediate Python objects.
+
+    Usage:
+        QueryBody = JsonBody(QUERY_REQUEST_ADAPTER)
+
+        @router.post("/query", openapi_extra=QueryBody.openapi_extra)
+        async def run_query(query: QueryRequest = Depends(QueryBody)):
+            ...
+    """
+
+    def __init__(self, adapter: TypeAdapter[T]):
+        """
+        Initialize with the adapter for the body type.
+
+        Args:
+            adapter: Module-level TypeAdapter whose core schema is reused per request
+        """
+        self.adapter = adapter
+
+    @functools.cached_property
+    def openapi_extra(self) -> dict[str, Any]:
+        """OpenAPI request body entry, since the route no longer declares a body parameter."""
+        schema = self.adapter.json_schema()
+        defs = schema.pop("$defs", {})
+
+        # Inline local $defs; "#/$defs/..." would resolve against the OpenAPI document
+        def resolve(node: Any) -> Any:
+            if isinstance(node, dict):
+                ref = node.get("$ref", "")
+                if ref.startswith("#/$defs/"):
+                    return resolve(defs[ref.rsplit("/", 1)[-1]])
+                return {key: resolve(value) for key, value in node.items()}
+            if isinstance(node, list):
+                return [resolve(value) for value in node]
+            return node
+
+        return {
+            "requestBody": {
+                "required": True,
+                "content": {"application/json": {"schema": resolve(schema)}},
+            }
+        }
+
+    async def __call__(self, request: Request) -> T:
+        """
+        Validate the request body against the adapter.
+
+        Raises:
+            RequestValidationError: With the same "body" error locations FastAPI
+                reports for a declared body parameter
+        """
+        try:
+            return self.adapter.validate_json(await request.body())
+        except ValidationError as e:
+            errors = [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in e.errors(include_url=False)
+            ]
+            raise RequestValidationError(errors) from e
+
+
 def transactional(func: Callable[..., R]) -> Callable[..., R]:
     """
     Decorator for transaction management.
@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, SkipValidation
 from typing import Literal
 
 
@@ -55,7 +55,12 @@ class RunSqlData(BaseModel):
     Result model for SQL execution, used internally.
     """
 
-    data: str  # JSON string of records
+    data: Optional[str] = None  # JSON string of records
+    # Rows as returned by the driver (Decimal, date, ...) for transports that
+    # encode them directly; not validated and not part of the dump
+    rows: SkipValidation[list[dict[str, Any]]] = Field(
+        default_factory=list, exclude=True
+    )
     should_visualize: bool
     executed_sql: Optional[str] = None
     insight: Optional[InsightSummary] = None
@@ -5,20 +5,46 @@ This module provides the repository pattern implementation for accessing
 and managing chat conversations in the database.
 """
 
+import re
 import uuid
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
 from loguru import logger
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import JSON, desc, func, literal_column, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from chatbi.database import get_async_session
 from chatbi.domain.chat.entities import ChatHistory, ChatMessage, ChatSession
 from chatbi.domain.common.repository import AsyncBaseRepository, BaseRepository
 from chatbi.exceptions import BadRequestError, DatabaseError, NotFoundError
 
+# Plain ASCII words can be answered from the GIN index on
+# to_tsvector('simple', content); anything else (LIKE wildcards, CJK text
+# that the 'simple' parser does not split into words) needs a substring scan.
+_FTS_QUERY_PATTERN = re.compile(r"[A-Za-z0-9]+(?:\s+[A-Za-z0-9]+)*")
+_FTS_CONFIG = literal_column("'simple'::regconfig")
+
+
+def _message_search_clause(query: str) -> Any:
+    """
+    Build the WHERE clause used to search chat message content.
+
+    Args:
+        query: Stripped, non-empty search text
+
+    Returns:
+        Full-text match for plain word queries, ILIKE substring match otherwise
+    """
+    if _FTS_QUERY_PATTERN.fullmatch(query):
+        return func.to_tsvector(_FTS_CONFIG, ChatMessage.content).op("@@")(
+            func.plainto_tsquery(_FTS_CONFIG, query)
+        )
+    return ChatMessage.content.ilike(f"%{query}%")
+
 
 class ChatRepository(BaseRepository[ChatSession]):
     """
@@ -41,11 +67,9 @@ class ChatRepository(BaseRepository[ChatSession]):
             Chat session if found, None otherwise
         """
         try:
-            return (
-                self.db.query(self.model_class)
-                .filter(self.model_class.id == id)
-                .first()
-            )
+            return self.db.execute(
+                select(self.model_class).where(self.model_class.id == id)
+            ).scalar_one_or_none()
         except Exception as e:
             logger.error(f"Error retrieving chat session: {e!s}")
             raise DatabaseError(f"Failed to retrieve chat session: {e!s}")
@@ -61,12 +85,12 @@ class ChatRepository(BaseRepository[ChatSession]):
             List of chat messages
         """
         try:
-            return (
-                self.db.query(ChatMessage)
+            result = self.db.execute(
+                select(ChatMessage)
                 .filter(ChatMessage.session_id == session_id)
                 .order_by(ChatMessage.timestamp.asc())
-                .all()
             )
+            return list(result.scalars().all())
         except Exception as e:
             logger.error(f"Error retrieving chat messages: {e!s}")
             raise DatabaseError(f"Failed to retrieve chat messages: {e!s}")
@@ -107,11 +131,12 @@ class ChatRepository(BaseRepository[ChatSession]):
             self.db.flush()
             self.db.refresh(message)
 
-            # Update session's last_active timestamp
-            session = self.get_chat_session_by_id(message.session_id)
-            if session:
-                session.last_active = datetime.utcnow()
-                self.db.flush()
+            # Update session's last_active timestamp using the database clock
+            self.db.execute(
+                update(ChatSession)
+                .where(ChatSession.id == message.session_id)
+                .values(last_active=func.now())
+            )
 
             return message
         except Exception as e:
@@ -188,13 +213,13 @@ class ChatRepository(BaseRepository[ChatSession]):
             List of chat sessions for the user, ordered by last_active desc
         """
         try:
-            return (
-                self.db.query(ChatSession)
+            result = self.db.execute(
+                select(ChatSession)
                 .filter(ChatSession.user_id == user_id)
                 .order_by(desc(ChatSession.last_active))
                 .limit(limit)
-                .all()
             )
+            return list(result.scalars().all())
         except Exception as e:
             logger.error(f"Error retrieving chat sessions by user: {e!s}")
             raise DatabaseError(f"Failed to retrieve chat sessions by user: {e!s}")
@@ -210,12 +235,10 @@ class ChatRepository(BaseRepository[ChatSession]):
             List of most recent chat sessions
         """
         try:
-            return (
-                self.db.query(ChatSession)
-                .order_by(desc(ChatSession.last_active))
-                .limit(limit)
-                .all()
+            result = self.db.execute(
+                select(ChatSession).order_by(desc(ChatSession.last_active)).limit(limit)
             )
+            return list(result.scalars().all())
         except Exception as e:
             logger.error(f"Error retrieving recent chat sessions: {e!s}")
             raise DatabaseError(f"Failed to retrieve recent chat sessions: {e!s}")
@@ -231,17 +254,19 @@ class ChatRepository(BaseRepository[ChatSession]):
         Returns:
             List of matching messages
         """
-        try:
-            # This uses SQL LIKE for case-insensitive search
-            search_term = f"%{query}%"
+        query = query.strip()
+        if not query:
+            # An empty term would match every row via ILIKE '%%'
+            return []
 
-            return (
-                self.db.query(ChatMessage)
-                .filter(ChatMessage.content.ilike(search_term))
+        try:
+            result = self.db.execute(
+                select(ChatMessage)
+                .filter(_message_search_clause(query))
                 .order_by(desc(ChatMessage.timestamp))
                 .limit(limit)
-                .all()
             )
+            return list(result.scalars().all())
         except Exception as e:
             logger.error(f"Error searching chat messages: {e!s}")
             raise DatabaseError(f"Failed to search chat messages: {e!s}")
@@ -255,23 +280,44 @@ class ChatRepository(BaseRepository[ChatSession]):
         """
         try:
             # Get total count of chat sessions
-            session_count = self.db.query(func.count(ChatSession.id)).scalar() or 0
+            session_count = (
+                self.db.execute(
+                    select(func.count()).select_from(ChatSession)
+                ).scalar_one()
+                or 0
+            )
 
             # Get count of chat messages
-            message_count = self.db.query(func.count(ChatMessage.id)).scalar() or 0
+            message_count = (
+                self.db.execute(
+                    select(func.count()).select_from(ChatMessage)
+                ).scalar_one()
+                or 0
+            )
 
             # Get user count
             user_count = (
-                self.db.query(func.count(func.distinct(ChatSession.user_id))).scalar()
+                self.db.execute(
+                    select(func.count(func.distinct(ChatSession.user_id))).select_from(
+                        ChatSession
+                    )
+                ).scalar_one()
                 or 0
             )
 
             # Get success rate from chat history
-            total_history = self.db.query(func.count(ChatHistory.id)).scalar() or 0
+            total_history = (
+                self.db.execute(
+                    select(func.count()).select_from(ChatHistory)
+                ).scalar_one()
+                or 0
+            )
             success_history = (
-                self.db.query(func.count(ChatHistory.id))
-                .filter(ChatHistory.success == True)
-                .scalar()
+                self.db.execute(
+                    select(func.count())
+                    .select_from(ChatHistory)
+                    .filter(ChatHistory.success == True)
+                ).scalar_one()
                 or 0
             )
             success_rate = success_history / total_history if total_history > 0 else 0
@@ -310,9 +356,9 @@ class AsyncChatRepository(AsyncBaseRepository[ChatSession]):
         """
         try:
             result = await self.db.execute(
-                select(self.model_class).filter(self.model_class.id == id)
+                select(self.model_class).where(self.model_class.id == id)
             )
-            return result.scalars().first()
+            return result.scalar_one_or_none()
         except Exception as e:
             logger.error(f"Error retrieving chat session: {e!s}")
             raise DatabaseError(f"Failed to retrieve chat session: {e!s}")
@@ -376,11 +422,12 @@ class AsyncChatRepository(AsyncBaseRepository[ChatSession]):
             await self.db.flush()
             await self.db.refresh(message)
 
-            # Update session's last_active timestamp
-            session = await self.get_chat_session_by_id(message.session_id)
-            if session:
-                session.last_active = datetime.utcnow()
-                await self.db.flush()
+            # Update session's last_active timestamp using the database clock
+            await self.db.execute(
+                update(ChatSession)
+                .where(ChatSession.id == message.session_id)
+                .values(last_active=func.now())
+            )
 
             return message
         except Exception as e:
@@ -439,6 +486,91 @@ class AsyncChatRepository(AsyncBaseRepository[ChatSession]):
             # Don't raise - history recording should not interrupt the main flow
             return None
 
+    @classmethod
+    async def save_chat_history_detached(cls, history_data: dict[str, Any]) -> None:
+        """
+        Save a chat history record in its own session and transaction.
+
+        Used from background tasks that run after the response has been
+        sent, when the request-scoped session is no longer usable.
+
+        Args:
+            history_data: Dictionary containing history record attributes
+        """
+        try:
+            async with get_async_session() as session:
+                await cls(session).save_chat_history(history_data)
+        except Exception as e:
+            logger.error(f"Error saving chat history in background: {e!s}")
+
+    async def bulk_load_history(
+        self, rows: list[dict[str, Any]], rebuild_indexes: bool = False
+    ) -> int:
+        """
+        Bulk insert chat history records with PostgreSQL COPY.
+
+        Intended for offline backfills/ingest scripts, not the request path.
+        Columns with a server default (created_at, updated_at) are left to
+        the database; id, timestamp and success fall back to the same
+        defaults the ORM would apply.
+
+        Args:
+            rows: History records keyed by ChatHistory column name
+            rebuild_indexes: Drop the chat_history secondary indexes before
+                the COPY and recreate them afterwards, which is much faster
+                than maintaining them row by row for large loads
+
+        Returns:
+            Number of rows copied
+        """
+        if not rows:
+            return 0
+
+        table = ChatHistory.__table__
+        columns = [c for c in table.columns if c.server_default is None]
+        json_columns = {c.name for c in columns if isinstance(c.type, JSON)}
+        now = datetime.utcnow()
+
+        records = []
+        for row in rows:
+            record = []
+            for column in columns:
+                value = row.get(column.name)
+                if value is None:
+                    if column.name == "id":
+                        value = str(uuid.uuid4())
+                    elif column.name == "timestamp":
+                        value = now
+                    elif column.name == "success":
+                        value = True
+                elif column.name in json_columns:
+                    value = orjson.dumps(value).decode()
+                record.append(value)
+            records.append(tuple(record))
+
+        try:
+            conn = await self.db.connection()
+            if rebuild_indexes:
+                for index in table.indexes:
+                    await conn.run_sync(index.drop, checkfirst=True)
+
+            raw_conn = await conn.get_raw_connection()
+            await raw_conn.driver_connection.copy_records_to_table(
+                table.name,
+                records=records,
+                columns=[c.name for c in columns],
+            )
+
+            if rebuild_indexes:
+                for index in table.indexes:
+                    await conn.run_sync(index.create, checkfirst=True)
+
+            logger.info(f"Bulk loaded {len(records)} chat history records")
+            return len(records)
+        except Exception as e:
+            logger.error(f"Error bulk loading chat history: {e!s}")
+            raise DatabaseError(f"Failed to bulk load chat history: {e!s}")
+
     async def get_chat_sessions_by_user_id(
         self, user_id: str, limit: int = 50
     ) -> list[ChatSession]:
@@ -496,13 +628,15 @@ class AsyncChatRepository(AsyncBaseRepository[ChatSession]):
         Returns:
             List of matching messages
         """
-        try:
-            # This uses SQL LIKE for case-insensitive search
-            search_term = f"%{query}%"
+        query = query.strip()
+        if not query:
+            # An empty term would match every row via ILIKE '%%'
+            return []
 
+        try:
             result = await self.db.execute(
                 select(ChatMessage)
-                .filter(ChatMessage.content.ilike(search_term))
+                .filter(_message_search_clause(query))
                 .order_by(desc(ChatMessage.timestamp))
                 .limit(limit)
             )
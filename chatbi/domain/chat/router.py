@@ -4,7 +4,9 @@ Chat router with improved database dependency injection.
 This module provides FastAPI routes for handling chat functionality with standardized responses.
 """
 
-from fastapi import APIRouter, Depends, Request, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from chatbi.dependencies import PostgresSessionDep, RepositoryDependency
@@ -23,6 +25,12 @@ from chatbi.domain.chat.repository import ChatRepository
 from chatbi.domain.chat.service import ChatService
 from chatbi.domain.datasource.repository import DatasourceRepository
 from chatbi.middleware.standard_response import StandardResponse
+from chatbi.utils import (
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    iter_rows_as_ndjson,
+    rows_to_arrow_ipc,
+)
 
 # Create unified dependency provider for repository
 # By default, use synchronous session for backward compatibility
@@ -208,6 +216,7 @@ async def init_conversation(
 async def analyze(
     request: Request,
     dto: ChatDTO,
+    background_tasks: BackgroundTasks,
     repo: ChatRepository = Depends(ChatRepoDep),
     datasource_repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[ChatAnalysisResponse]:
@@ -217,13 +226,16 @@ async def analyze(
     Args:
         request: FastAPI request object
         dto: Chat data
+        background_tasks: Background tasks used for history writes
         repo: Repository instance from dependency
         datasource_repo: Datasource repository instance
 
     Returns:
         Standardized response with analysis results
     """
-    chat_service = ChatService(repo=repo, datasource_repo=datasource_repo)
+    chat_service = ChatService(
+        repo=repo, datasource_repo=datasource_repo, background_tasks=background_tasks
+    )
     result = await chat_service.analysis(request, dto)
 
     return StandardResponse(
@@ -240,6 +252,7 @@ async def analyze(
 async def generate_sql(
     request: Request,
     dto: ChatDTO,
+    background_tasks: BackgroundTasks,
     repo: ChatRepository = Depends(ChatRepoDep),
     datasource_repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[CommonResponse]:
@@ -249,13 +262,16 @@ async def generate_sql(
     Args:
         request: FastAPI request object
         dto: Chat data
+        background_tasks: Background tasks used for history writes
         repo: Repository instance from dependency
         datasource_repo: Datasource repository instance
 
     Returns:
         Standardized response with generated SQL
     """
-    chat_service = ChatService(repo=repo, datasource_repo=datasource_repo)
+    chat_service = ChatService(
+        repo=repo, datasource_repo=datasource_repo, background_tasks=background_tasks
+    )
     result = await chat_service.generate_sql(request, dto.id, dto.question)
 
     # Convert AgentMessage to CommonResponse
@@ -279,27 +295,70 @@ async def generate_sql(
 async def run_sql(
     request: Request,
     dto: RunSqlRequest,
+    background_tasks: BackgroundTasks,
     repo: ChatRepository = Depends(ChatRepoDep),
     datasource_repo: DatasourceRepository = Depends(DatasourceRepoDep),
-) -> StandardResponse[SqlResultResponse]:
+) -> StandardResponse[SqlResultResponse] | Response:
     """
     Execute SQL query and return results.
 
     Args:
         request: FastAPI request object
         dto: Run SQL request data
+        background_tasks: Background tasks used for history writes
         repo: Repository instance from dependency
         datasource_repo: Datasource repository instance
 
     Returns:
-        Standardized response with query results
+        Standardized response with query results, an Arrow IPC stream when the
+        client accepts application/vnd.apache.arrow.stream, or an NDJSON stream
+        (one metadata line, then one line per row) when it accepts
+        application/x-ndjson
     """
-    chat_service = ChatService(repo=repo, datasource_repo=datasource_repo)
-    result = await chat_service.run_sql(request, dto.id, dto.sql, dto.timeout, dto.max_rows)
+    accept = request.headers.get("accept", "")
+    wants_ndjson = NDJSON_MEDIA_TYPE in accept
+    # Arrow and NDJSON are built from the driver rows, so the JSON text is not needed
+    wants_arrow = ARROW_STREAM_MEDIA_TYPE in accept and not wants_ndjson
+
+    chat_service = ChatService(
+        repo=repo, datasource_repo=datasource_repo, background_tasks=background_tasks
+    )
+    result = await chat_service.run_sql(
+        request,
+        dto.id,
+        dto.sql,
+        dto.timeout,
+        dto.max_rows,
+        encode_rows=not (wants_arrow or wants_ndjson),
+    )
+
+    # Row-streamed transport for large results; rows are encoded one at a time
+    if wants_ndjson:
+        header = {
+            "should_visualize": result.should_visualize,
+            "executed_sql": result.executed_sql,
+            "insight": result.insight.model_dump(mode="json") if result.insight else None,
+        }
+        return StreamingResponse(
+            iter_rows_as_ndjson(result.rows, header), media_type=NDJSON_MEDIA_TYPE
+        )
+
+    # Columnar transport for clients that can read Arrow directly; the driver
+    # rows keep Decimal/date/timestamp values so Arrow infers real column types
+    if wants_arrow:
+        metadata = {
+            "should_visualize": str(result.should_visualize).lower(),
+            "executed_sql": result.executed_sql or "",
+        }
+        if result.insight is not None:
+            metadata["insight"] = result.insight.model_dump_json()
+        return Response(
+            content=rows_to_arrow_ipc(result.rows, metadata),
+            media_type=ARROW_STREAM_MEDIA_TYPE,
+        )
 
     # Parse JSON string to list
-    import json
-    data_list = json.loads(result.data) if isinstance(result.data, str) else result.data
+    data_list = orjson.loads(result.data)
 
     return StandardResponse(
         status="success",
@@ -336,7 +395,9 @@ async def generate_visualize(
         Standardized response with visualization configuration
     """
     chat_service = ChatService(repo=repo)
-    result = chat_service.generate_visualize(request=request, id=dto.id, sql=dto.text)
+    result = await chat_service.generate_visualize(
+        request=request, id=dto.id, sql=dto.text
+    )
 
     return StandardResponse(
         status="success", message="Visualization generated successfully", data=result
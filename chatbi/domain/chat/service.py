@@ -6,17 +6,24 @@ data querying, and visualization generation with improved database access throug
 the repository pattern.
 """
 
-import json
+import asyncio
 import os
-from functools import wraps
+import re
+from functools import lru_cache, wraps
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from decimal import Decimal
+from numbers import Number
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import uuid4
 
 import orjson
-import pandas as pd
+import xxhash
+from cachetools import LRUCache
 import dspy
-from fastapi import HTTPException, Request, status
+import sqlglot
+from sqlglot import exp
+from sqlglot.tokens import TokenType
+from fastapi import BackgroundTasks, HTTPException, Request, status
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.orm import Session
@@ -45,23 +52,149 @@ from chatbi.agent.langchain_orchestrator import SmartBILangChainOrchestrator
 from chatbi.domain.diagnosis.repository import CorrectionLogRepository, DiagnosisRepository
 from chatbi.domain.diagnosis.entities import DiagnosisResult
 from chatbi.domain.diagnosis.dtos import InsightSummary
-# SQLExecutionPipeline imported locally to avoid circular dependency
+from chatbi.database import get_async_session
 from chatbi.database.connection_manager import ConnectionManager
 from chatbi.domain.datasource import DatabaseType
-from chatbi.domain.datasource.dtos import (
-    ConnectionInfo,
-    PostgresConnectionInfo,
-    MySqlConnectionInfo,
-    DuckDbConnectionInfo,
-    MSSqlConnectionInfo,
-    SnowflakeConnectionInfo,
-    BigQueryConnectionInfo,
-    ClickHouseConnectionInfo,
-    TrinoConnectionInfo,
-    ConnectionUrl
-)
 from chatbi.exceptions import BadRequestError, DatabaseError, NotFoundError
 
+if TYPE_CHECKING:
+    from chatbi.pipelines.execution.execution_pipeline import SQLExecutionPipeline
+
+
+@lru_cache(maxsize=1)
+def _sql_execution_pipeline_cls() -> type["SQLExecutionPipeline"]:
+    """Resolve SQLExecutionPipeline once; a module-level import is circular."""
+    from chatbi.pipelines.execution.execution_pipeline import SQLExecutionPipeline
+
+    return SQLExecutionPipeline
+
+
+# Phrases the SQL agent emits instead of SQL when it cannot answer
+_SQL_FAILURE_RE = re.compile(
+    r"无法生成|UNABLE TO|CANNOT GENERATE|INSUFFICIENT|CAN'T GENERATE|NOT ENOUGH|MISSING",
+    re.IGNORECASE,
+)
+# Leading "--" comment lines (and the whitespace after them) to strip
+_SQL_LEADING_COMMENTS_RE = re.compile(r"(?:--[^\n]*(?:\n|$)\s*)*")
+# Common SQL starting keywords accepted from the SQL agent
+_SQL_VALID_START_RE = re.compile(
+    r"SELECT|WITH|SHOW|DESC|EXPLAIN|VALUES|INSERT|UPDATE|DELETE", re.IGNORECASE
+)
+
+# sqlglot dialect names that differ from the DatabaseType value
+_SQLGLOT_DIALECTS = {DatabaseType.MSSQL: "tsql"}
+
+
+@lru_cache(maxsize=256)
+def _apply_row_limit(sql: str, max_rows: int, dialect: str) -> str:
+    """
+    Add a row limit to a query that does not already have one.
+
+    The query is parsed with sqlglot, so identifiers or comments that merely
+    contain the word "limit" do not suppress the limit. The limit clause is
+    spliced into the original text rather than re-rendering the parsed tree,
+    which keeps the query's comments and formatting intact. Dialects without
+    LIMIT (T-SQL) get a TOP clause on the outermost SELECT instead.
+
+    Args:
+        sql: SQL query to limit
+        max_rows: Maximum number of rows to return
+        dialect: sqlglot dialect of the target database
+
+    Returns:
+        The SQL with a row limit applied where possible
+    """
+    try:
+        statements = [tree for tree in sqlglot.parse(sql, read=dialect) if tree]
+        tokens = sqlglot.tokenize(sql, read=dialect)
+    except sqlglot.errors.SqlglotError:
+        # Leave SQL that sqlglot cannot parse for the database to judge
+        return sql
+
+    # Multi-statement input is left alone; a limit on only the last
+    # statement would be misleading and the driver caps the rows anyway
+    if len(statements) != 1:
+        return sql
+    tree = statements[0]
+    if not isinstance(tree, exp.Query) or any(
+        tree.args.get(arg) for arg in ("limit", "offset", "locks")
+    ):
+        return sql
+
+    if dialect == "tsql":
+        if not isinstance(tree, exp.Select):
+            return sql
+        # Insert TOP after the outermost SELECT [DISTINCT | ALL] keyword
+        depth = 0
+        for index, token in enumerate(tokens):
+            if token.token_type == TokenType.L_PAREN:
+                depth += 1
+            elif token.token_type == TokenType.R_PAREN:
+                depth -= 1
+            elif depth == 0 and token.token_type == TokenType.SELECT:
+                anchor = token
+                following = tokens[index + 1] if index + 1 < len(tokens) else None
+                if following and following.token_type in (
+                    TokenType.DISTINCT,
+                    TokenType.ALL,
+                ):
+                    anchor = following
+                end = anchor.end + 1
+                return f"{sql[:end]} TOP {max_rows}{sql[end:]}"
+        return sql
+
+    # Append LIMIT right after the last token that is not a semicolon, so
+    # any trailing semicolon or comment stays where it was
+    body_tokens = [t for t in tokens if t.token_type != TokenType.SEMICOLON]
+    if not body_tokens:
+        return sql
+    end = body_tokens[-1].end + 1
+    return f"{sql[:end]} LIMIT {max_rows}{sql[end:]}"
+
+
+def _is_empty_schema(table_schema: Any) -> bool:
+    """
+    Check whether a table schema carries no table definitions.
+
+    Schemas arrive either as a list of tables or as their JSON text, so
+    None, an empty list and the strings "" / "[]" all count as empty.
+
+    Args:
+        table_schema: Table schema as a list or JSON string
+
+    Returns:
+        True if the schema has no tables
+    """
+    if isinstance(table_schema, (list, str)):
+        return len(table_schema) == 0 or table_schema == "[]"
+    return not table_schema
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps_rows(rows: list[Any]) -> str:
+    """
+    Serialize SQL result rows to a JSON string.
+
+    orjson encodes date/datetime (ISO 8601) and numpy values natively, so
+    rows are dumped as returned by the driver without a per-row
+    conversion pass; only Decimal goes through the default hook.
+
+    Args:
+        rows: Result rows as returned by the connection manager
+
+    Returns:
+        JSON text of the rows
+    """
+    return orjson.dumps(
+        rows, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
 
 def requires_cache(
     required_fields: list[str], optional_fields: list[str] | None = None
@@ -98,25 +231,22 @@ def requires_cache(
                     detail="ChatSession ID is required",
                 )
 
+            # Fetch required and optional fields in a single cache round trip
+            cached = cache.mget(id, required_fields + optional_fields) or {}
+
             # Check for required fields in cache
             for field in required_fields:
-                if cache.get(id=id, field=field) is None:
+                if cached.get(field) is None:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Missing required context: {field}",
                     )
 
-            # Extract values from cache
+            # Extract values from cache, skipping optional fields that are unset
             field_values = {
-                field: cache.get(id=id, field=field) for field in required_fields
+                field: value for field, value in cached.items() if value is not None
             }
 
-            # Add optional fields if they exist
-            for field in optional_fields:
-                field_value = cache.get(id=id, field=field)
-                if field_value is not None:
-                    field_values[field] = field_value
-
             # Remove duplicates that already exist in kwargs
             field_values = {k: v for k, v in field_values.items() if k not in kwargs}
 
@@ -135,9 +265,25 @@ class ChatService:
     """
 
     _MAX_ROWS_DEFAULT = 1000
+    # Upper bound on datasources queried at once when building the schema
+    _SCHEMA_FETCH_CONCURRENCY = 8
     _table_schema = None
-
-    def __init__(self, repo: ChatRepository, datasource_repo: DatasourceRepository = None, cache: Cache = None):
+    # Pretty-printed JSON of _table_schema, encoded once alongside it
+    _table_schema_json: Optional[str] = None
+    # In-flight schema fetches shared by concurrent requests, keyed by datasource
+    _schema_fetches: dict[Optional[str], asyncio.Future] = {}
+    # Diagnosis agent answers keyed by (question, sql, data sample digest)
+    _diagnosis_cache: LRUCache = LRUCache(maxsize=1024)
+    # Fire-and-forget history writes still in flight
+    _pending_history_writes: set[asyncio.Task] = set()
+
+    def __init__(
+        self,
+        repo: ChatRepository,
+        datasource_repo: DatasourceRepository = None,
+        cache: Cache = None,
+        background_tasks: Optional[BackgroundTasks] = None,
+    ):
         """
         Initialize the chat service with repository and cache dependencies.
 
@@ -145,6 +291,8 @@ class ChatService:
             repo: Chat repository for database access (required)
             datasource_repo: Datasource repository for schema access (optional)
             cache: Cache implementation (defaults to MemoryCache)
+            background_tasks: Request background tasks; when given, history
+                records are written after the response is sent
         """
 
         if repo is None:
@@ -153,6 +301,7 @@ class ChatService:
         self.repo = repo
         self.datasource_repo = datasource_repo
         self.cache = cache or MemoryCache()
+        self.background_tasks = background_tasks
         self.correction_repo = CorrectionLogRepository(repo.db)
         self.diagnosis_repo = DiagnosisRepository(repo.db)
         self.sql_agent = SqlAgent()
@@ -262,6 +411,29 @@ class ChatService:
             },
         )
 
+    async def _record_history(self, history_data: dict[str, Any]) -> None:
+        """
+        Record a chat history entry without blocking the response.
+
+        The write always uses its own session. With request background tasks
+        available it runs after the response is sent; otherwise it is
+        scheduled as a fire-and-forget task on the running event loop.
+
+        Args:
+            history_data: Dictionary containing history record attributes
+        """
+        if self.background_tasks is not None:
+            self.background_tasks.add_task(
+                AsyncChatRepository.save_chat_history_detached, history_data
+            )
+            return
+        task = asyncio.create_task(
+            AsyncChatRepository.save_chat_history_detached(history_data)
+        )
+        # Hold a reference until the write finishes so it isn't collected
+        self._pending_history_writes.add(task)
+        task.add_done_callback(self._pending_history_writes.discard)
+
     def set_cache(self, id: str, value: str = "test") -> str:
         """
         Set a test value in the cache.
@@ -358,58 +530,116 @@ class ChatService:
                 detail=f"Failed to create chat session: {e!s}",
             )
 
-    async def get_table_schema(self, datasource_id: Optional[str] = None) -> Any:
+    async def _fetch_datasource_tables(
+        self, ds: Any, semaphore: asyncio.Semaphore
+    ) -> list[dict[str, Any]]:
         """
-        Get the database schema.
+        Fetch the table definitions of a single datasource.
 
         Args:
-            datasource_id: Optional ID of specific datasource to fetch schema from
+            ds: Datasource entity
+            semaphore: Limits how many datasources are queried at once
 
         Returns:
-            Schema sort of as a list of table definitions
+            Table definitions, or an empty list if the fetch failed
         """
-        if self._table_schema:
-            return self._table_schema
+        async with semaphore:
+            try:
+                # Read connection info directly from datasource config.
+                conn_info_dict = getattr(ds, "connection_info", getattr(ds, "config", {}))
+
+                if not conn_info_dict:
+                    return []
 
+                db_type = DatabaseType(ds.type)
+
+                # Fetch schema metadata
+                meta = await ConnectionManager.get_schema_metadata(db_type, conn_info_dict)
+
+                if not meta or "tables" not in meta:
+                    return []
+                tables = meta["tables"]
+                if isinstance(tables, dict):
+                    tables = list(tables.values())
+                logger.debug(f"Fetched {len(tables)} tables from datasource {ds.name}")
+                return tables
+            except Exception as e:
+                logger.warning(f"Failed to fetch schema for datasource {ds.name}: {e}")
+                return []
+
+    async def _load_table_schema(
+        self, datasource_id: Optional[str] = None
+    ) -> tuple[list[dict[str, Any]], str]:
+        """
+        Fetch table definitions from the datasources and encode them.
+
+        The fetch is shared by concurrent requests and may outlive the one
+        that started it, so it opens its own session rather than borrowing
+        the request-scoped one.
+
+        Args:
+            datasource_id: Optional ID of specific datasource to fetch schema from
+
+        Returns:
+            Tuple of the table definitions and their pretty-printed JSON
+        """
         schemas = []
-        if self.datasource_repo:
-            try:
+        try:
+            async with get_async_session() as session:
+                datasource_repo = DatasourceRepository(session)
                 # Fetch specified datasource or all active ones
                 datasources = []
                 if datasource_id:
-                    ds = await self.datasource_repo.get_by_id(datasource_id)
+                    ds = await datasource_repo.get_by_id(datasource_id)
                     if ds:
                         datasources.append(ds)
                 else:
                     # Only fetch active datasources
-                    datasources = await self.datasource_repo.get_all(status_filter="active")
+                    datasources = await datasource_repo.get_all(status_filter="active")
 
                 logger.debug(f"Found {len(datasources)} datasources to fetch schema from")
 
-                for ds in datasources:
-                    try:
-                        # Read connection info directly from datasource config.
-                        conn_info_dict = getattr(ds, "connection_info", getattr(ds, "config", {}))
+                # Fetch all datasources concurrently; each one is a remote round trip
+                semaphore = asyncio.Semaphore(self._SCHEMA_FETCH_CONCURRENCY)
+                results = await asyncio.gather(
+                    *(self._fetch_datasource_tables(ds, semaphore) for ds in datasources)
+                )
+                schemas = [table for tables in results for table in tables]
+        except Exception as e:
+            logger.error(f"Error fetching datasources: {e}")
 
-                        if not conn_info_dict:
-                            continue
+        return schemas, orjson.dumps(schemas, option=orjson.OPT_INDENT_2).decode()
 
-                        db_type = DatabaseType(ds.type)
+    async def get_table_schema(self, datasource_id: Optional[str] = None) -> Any:
+        """
+        Get the database schema.
 
-                        # Fetch schema metadata
-                        meta = await ConnectionManager.get_schema_metadata(db_type, conn_info_dict)
+        Concurrent cold-cache calls for the same datasource share a single
+        in-flight fetch instead of each querying every datasource.
 
-                        if meta and "tables" in meta:
-                            tables = meta["tables"]
-                            if isinstance(tables, dict):
-                                tables = list(tables.values())
-                            logger.debug(f"Fetched {len(tables)} tables from datasource {ds.name}")
-                            schemas.extend(tables)
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch schema for datasource {ds.name}: {e}")
+        Args:
+            datasource_id: Optional ID of specific datasource to fetch schema from
 
-            except Exception as e:
-                logger.error(f"Error fetching datasources: {e}")
+        Returns:
+            Schema sort of as a list of table definitions
+        """
+        if self._table_schema:
+            return self._table_schema
+
+        schemas, schemas_json = [], "[]"
+        if self.datasource_repo:
+            fetch = self._schema_fetches.get(datasource_id)
+            if fetch is None:
+                fetch = asyncio.ensure_future(self._load_table_schema(datasource_id))
+                self._schema_fetches[datasource_id] = fetch
+
+                def _forget(done: asyncio.Future, key: Optional[str] = datasource_id) -> None:
+                    if self._schema_fetches.get(key) is done:
+                        del self._schema_fetches[key]
+
+                fetch.add_done_callback(_forget)
+            # Shield so a cancelled waiter does not cancel the shared fetch
+            schemas, schemas_json = await asyncio.shield(fetch)
         else:
             logger.warning("No datasource repository available. Returning empty schema.")
 
@@ -417,7 +647,8 @@ class ChatService:
             logger.warning("No schemas found from datasources. Using empty schema.")
 
         self._table_schema = schemas
-        logger.debug(f"Table schema: {self._table_schema}")
+        self._table_schema_json = schemas_json
+        logger.opt(lazy=True).debug("Table schema: {}", lambda: self._table_schema)
         return self._table_schema
 
     @transactional
@@ -438,6 +669,7 @@ class ChatService:
         Raises:
             HTTPException: If analysis fails
         """
+        insight_task = None
         try:
             # Initialize ChatSession ID if needed
             id = dto.id or self.cache.generate_id(question=dto.text)
@@ -537,8 +769,13 @@ class ChatService:
                 },
             )
 
-            repo = self.repo
-            
+            # Start schema retrieval now so it overlaps with intent classification
+            schema_task = None
+            if table_schema is None and tool_enable_sql:
+                schema_task = asyncio.create_task(
+                    self.get_table_schema(dto.datasource_id)
+                )
+
             # Step 0: Intent Classification
             try:
                 intent_msg = await self.intent_agent.replay(question=question_for_llm)
@@ -554,6 +791,8 @@ class ChatService:
                 
                 if intent == "clarification":
                     logger.info(f"Ambiguity detected, returning clarification request")
+                    if schema_task is not None:
+                        schema_task.cancel()
                     response["metadata"] = {
                         **(intent_msg.metadata or {}),
                         "scene": dto.scene,
@@ -610,11 +849,12 @@ class ChatService:
 
             # Step 1: Get table schema if not provided
             if table_schema is None:
-                all_table_schema = await self.get_table_schema(dto.datasource_id)
+                all_table_schema = await schema_task
                 logger.debug(f"Retrieved all_table_schema type: {type(all_table_schema)}, length: {len(all_table_schema) if isinstance(all_table_schema, (list, str)) else 'N/A'}")
 
                 # Retrieve relevant table schemas using SchemaAgent
-                schema_response = self.schema_agent.reply(
+                schema_response = await asyncio.to_thread(
+                    self.schema_agent.reply,
                     id=id,
                     question=question_for_llm,
                     table_schema=all_table_schema,
@@ -623,7 +863,7 @@ class ChatService:
                 logger.debug(f"SchemaAgent returned table_schema type: {type(table_schema)}, length: {len(table_schema) if isinstance(table_schema, list) else 'N/A'}")
                 
                 # Fallback: if SchemaAgent returns empty result, use all tables
-                if not table_schema or (isinstance(table_schema, list) and len(table_schema) == 0):
+                if _is_empty_schema(table_schema):
                     logger.warning(f"SchemaAgent returned empty schema, falling back to all tables")
                     table_schema = all_table_schema
                 
@@ -642,15 +882,7 @@ class ChatService:
             logger.debug(f"Final table schema type: {type(table_schema)}")
             
             # Validate table schema is not completely empty
-            is_empty = False
-            if table_schema is None:
-                is_empty = True
-            elif isinstance(table_schema, str) and (table_schema == "" or table_schema == "[]"):
-                is_empty = True
-            elif isinstance(table_schema, list) and len(table_schema) == 0:
-                is_empty = True
-            
-            if is_empty:
+            if _is_empty_schema(table_schema):
                 logger.error("Empty table schema - cannot generate SQL without schema information")
                 raise HTTPException(
                     status_code=status.HTTP_424_FAILED_DEPENDENCY,
@@ -686,39 +918,26 @@ class ChatService:
             if tool_enable_rule_validation:
                 # Validate SQL - reject if it contains failure messages or invalid formats
                 sql_stripped = sql.strip()
-                sql_upper = sql_stripped.upper()
-                
+
                 # Check for failure indicators
-                failure_indicators = [
-                    "无法生成", "UNABLE TO", "CANNOT GENERATE", "INSUFFICIENT",
-                    "CAN'T GENERATE", "NOT ENOUGH", "MISSING"
-                ]
-                if any(indicator in sql_upper for indicator in failure_indicators):
+                if _SQL_FAILURE_RE.search(sql_stripped):
                     logger.warning(f"SQL agent returned failure message: {sql}")
                     raise HTTPException(
                         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                         detail="Unable to generate SQL query. The AI model indicated insufficient context or unclear question. Please provide more details or rephrase your question."
                     )
-                
+
                 # Remove leading comments and check for valid SQL
-                sql_no_comments = sql_stripped
-                while sql_no_comments.startswith("--"):
-                    lines = sql_no_comments.split("\n", 1)
-                    if len(lines) > 1:
-                        sql_no_comments = lines[1].strip()
-                    else:
-                        sql_no_comments = ""
-                        break
-                
-                # Allow common SQL starting keywords
-                valid_starters = ("SELECT", "WITH", "SHOW", "DESC", "EXPLAIN", "VALUES", "INSERT", "UPDATE", "DELETE")
-                if not sql_no_comments or not sql_no_comments.upper().startswith(valid_starters):
+                sql_no_comments = sql_stripped[
+                    _SQL_LEADING_COMMENTS_RE.match(sql_stripped).end():
+                ]
+                if not _SQL_VALID_START_RE.match(sql_no_comments):
                     logger.warning(f"Invalid SQL generated: {sql}")
                     raise HTTPException(
                         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                         detail="Failed to generate valid SQL query. Please ensure your question is clear and relates to the available data."
                     )
-                
+
                 # Use the cleaned SQL without leading comments
                 sql = sql_no_comments
                 self._log_agent_step(
@@ -736,7 +955,10 @@ class ChatService:
                 )
 
             # Step 3: Run the generated SQL (limit to 20 rows for frontend performance)
-            run_sql_result = await self.run_sql(request=request, id=id, sql=sql, max_rows=20)
+            # Insights are generated below, concurrently with visualization
+            run_sql_result = await self.run_sql(
+                request=request, id=id, sql=sql, max_rows=20, generate_insight=False
+            )
             response["data"] = run_sql_result.data
             response["should_visualize"] = run_sql_result.should_visualize
             self._log_agent_step(
@@ -749,22 +971,43 @@ class ChatService:
             # Use executed_sql for visualization if it changed
             if run_sql_result.executed_sql:
                 response["executed_sql"] = run_sql_result.executed_sql
-                response["insight"] = run_sql_result.insight.model_dump() if run_sql_result.insight else None
                 sql = run_sql_result.executed_sql # Update sql variable for visualization step
 
+            data_list = []
+            try:
+                data_list = orjson.loads(run_sql_result.data)
+            except Exception as e:
+                logger.warning(f"Failed to parse query result data: {e}")
+
+            # Diagnose the result while the visualization agent runs
+            insight_task = asyncio.create_task(
+                self._generate_insight(id, question, sql, data_list)
+            )
+
+            # Record analysis history
+            try:
+                await self._record_history(
+                    {
+                        "conversation_id": id,
+                        "question": question,
+                        "sql": sql,
+                        "success": True,
+                    }
+                )
+            except Exception as e:
+                # Just log the error, don't fail the request
+                logger.error(f"Failed to record chat history: {e}")
+
             # Step 4: Generate visualization if requested
             if dto.visualize:
                 data_sample = None
-                try:
-                    data_list = json.loads(run_sql_result.data)
-                    # Use up to 3 records as sample data to help LLM understand data structure
-                    if isinstance(data_list, list) and len(data_list) > 0:
-                        data_sample = data_list[:3]
-                except Exception as e:
-                    logger.warning(f"Failed to parse data for visualization sample: {e}")
+                # Use up to 3 records as sample data to help LLM understand data structure
+                if isinstance(data_list, list) and len(data_list) > 0:
+                    data_sample = data_list[:3]
 
-                visualize_agent_result = self.visualize_agent.reply(
-                    id=id, 
+                visualize_agent_result = await asyncio.to_thread(
+                    self.visualize_agent.reply,
+                    id=id,
                     question=question_for_llm,
                     sql=sql, 
                     table_schema=table_schema,
@@ -781,6 +1024,9 @@ class ChatService:
                     logger.warning(f"Visualize agent returned invalid config type: {type(visualize_config)} - {visualize_config}")
                     response["visualize_config"] = None
 
+            insight = await insight_task
+            response["insight"] = insight.model_dump() if insight else None
+
             # Store data in cache for future use ONLY if analysis was successful
             # Verification logic:
             # 1. SQL was generated (implicit if we are here)
@@ -792,11 +1038,14 @@ class ChatService:
                 logger.warning(f"Analysis cache skipped due to invalid visualization config for ID {id}")
             
             if should_cache:
-                self.cache.set(id, "question", question)
-                self.cache.set(id, "table_schema", table_schema)
-                self.cache.set(id, "sql", sql)
+                cache_values = {
+                    "question": question,
+                    "table_schema": table_schema,
+                    "sql": sql,
+                }
                 if dto.datasource_id:
-                    self.cache.set(id, "datasource_id", dto.datasource_id)
+                    cache_values["datasource_id"] = dto.datasource_id
+                self.cache.set_many(id, cache_values)
 
             try:
                 self.memory_service.record_event(
@@ -814,7 +1063,7 @@ class ChatService:
                 data_size = 0
                 if response.get("data"):
                     try:
-                        data_size = len(json.loads(response.get("data") or "[]"))
+                        data_size = len(orjson.loads(response.get("data") or "[]"))
                     except Exception:
                         data_size = 0
                 self.memory_service.record_event(
@@ -845,26 +1094,15 @@ class ChatService:
                 "agent_profile": agent_profile,
                 "llm_source": llm_source,
             }
-            
-            # Record analysis metrics and history
-            try:
-                # Save history record
-                history_data = {
-                    "conversation_id": id,
-                    "question": question,
-                    "sql": sql,
-                    "success": True,
-                    # Add additional metrics here
-                }
-                repo.save_chat_history(history_data)
-            except Exception as e:
-                # Just log the error, don't fail the request
-                logger.error(f"Failed to record chat history: {e}")
 
             return response
 
         except Exception as e:
             logger.error(f"Error in analysis: {e!s}")
+            if insight_task is not None and not insight_task.done():
+                # Don't leave the diagnosis running on the request session
+                insight_task.cancel()
+                await asyncio.gather(insight_task, return_exceptions=True)
             self._log_agent_step(
                 profile_id=dto.agent_profile_id,
                 step="analysis",
@@ -923,32 +1161,62 @@ class ChatService:
             if table_schema is None:
                 logger.debug(f"Step 1: Getting all table schema")
                 all_table_schema = await self.get_table_schema()
-                logger.debug(f"Step 2: all_table_schema = {all_table_schema}, type = {type(all_table_schema)}")
-                schema_response = self.schema_agent.reply(
+                logger.opt(lazy=True).debug(
+                    "Step 2: all_table_schema = {}, type = {}",
+                    lambda: all_table_schema,
+                    lambda: type(all_table_schema),
+                )
+                schema_response = await asyncio.to_thread(
+                    self.schema_agent.reply,
                     id=id,
                     question=question,
                     table_schema=all_table_schema,
                 )
-                logger.debug(f"Step 3: schema_response = {schema_response}")
+                logger.opt(lazy=True).debug(
+                    "Step 3: schema_response = {}", lambda: schema_response
+                )
                 table_schema = schema_response.answer
-                logger.debug(f"Step 4: table_schema = {table_schema}, type = {type(table_schema)}")
+                logger.opt(lazy=True).debug(
+                    "Step 4: table_schema = {}, type = {}",
+                    lambda: table_schema,
+                    lambda: type(table_schema),
+                )
                 # Convert empty list to string to avoid JSON serialization issues
-                if isinstance(table_schema, list) and len(table_schema) == 0:
+                if _is_empty_schema(table_schema):
                     table_schema = "[]"
-                logger.debug(f"Step 5: Final table_schema = {table_schema}")
+                logger.opt(lazy=True).debug(
+                    "Step 5: Final table_schema = {}", lambda: table_schema
+                )
 
             # Generate SQL from question
             # Convert table_schema to JSON string if it's a list for better LLM understanding
             table_schema_str = table_schema
             if isinstance(table_schema, list):
                 # Log table names for debugging
-                table_names = [t.get('name', 'unknown') for t in table_schema if isinstance(t, dict)]
-                logger.info(f"Schema contains {len(table_schema)} tables: {', '.join(table_names)}")
-                table_schema_str = json.dumps(table_schema, ensure_ascii=False, indent=2)
+                logger.opt(lazy=True).info(
+                    "Schema contains {} tables: {}",
+                    lambda: len(table_schema),
+                    lambda: ", ".join(
+                        t.get("name", "unknown")
+                        for t in table_schema
+                        if isinstance(t, dict)
+                    ),
+                )
+                if table_schema is self._table_schema and self._table_schema_json:
+                    # Full schema was already encoded when it was fetched
+                    table_schema_str = self._table_schema_json
+                else:
+                    table_schema_str = orjson.dumps(
+                        table_schema, option=orjson.OPT_INDENT_2
+                    ).decode()
             
             logger.debug(f"About to call sql_agent.reply with table_schema type: {type(table_schema_str)}")
-            logger.info(f"Table schema being sent to SQL Agent (first 500 chars): {str(table_schema_str)[:500]}")
-            response = self.sql_agent.reply(
+            logger.opt(lazy=True).info(
+                "Table schema being sent to SQL Agent (first 500 chars): {}",
+                lambda: str(table_schema_str)[:500],
+            )
+            response = await asyncio.to_thread(
+                self.sql_agent.reply,
                 id=id,
                 question=question,
                 table_schema=table_schema_str,
@@ -963,11 +1231,9 @@ class ChatService:
             logger.debug(f"Generated SQL: {sql}")
 
             # Store in cache
-            self.cache.set(id, "question", question)
-            self.cache.set(id, "table_schema", table_schema)
-            self.cache.set(id, "sql", sql)
-
-            repo = self.repo
+            self.cache.set_many(
+                id, {"question": question, "table_schema": table_schema, "sql": sql}
+            )
 
             # Record SQL generation if successful
             try:
@@ -976,9 +1242,8 @@ class ChatService:
                     "question": question,
                     "sql": sql,
                     "success": True,
-                    "scene": dto.scene,
                 }
-                await repo.save_chat_history(history_data)
+                await self._record_history(history_data)
             except Exception as e:
                 # Just log the error, don't fail the request
                 logger.error(f"Failed to record SQL generation history: {e}")
@@ -1006,13 +1271,6 @@ class ChatService:
         if "```" in sql:
             sql = sql.replace("```sql", "").replace("```", "").strip()
 
-        # Ensure queries have a row limit for safety
-        if max_rows and "limit" not in sql.lower():
-            if sql.endswith(";"):
-                sql = f"{sql[:-1]} LIMIT {max_rows};"
-            else:
-                sql = f"{sql} LIMIT {max_rows};"
-
         datasource = None
         if datasource_id:
             datasource = await self.datasource_repo.get_by_id(datasource_id)
@@ -1038,6 +1296,11 @@ class ChatService:
                 detail=f"Unsupported database type: {datasource.type}",
             )
 
+        # Ensure queries have a row limit for safety
+        if max_rows:
+            dialect = _SQLGLOT_DIALECTS.get(database_type, database_type.value)
+            sql = _apply_row_limit(sql, max_rows, dialect)
+
         result = await connection_manager.execute_query(
             db_type=database_type,
             connection_info=datasource.connection_info,
@@ -1046,30 +1309,63 @@ class ChatService:
             max_rows=max_rows,
         )
 
-        # Convert result to DataFrame format for compatibility
-        rows = result.get("rows", [])
-        
-        # Convert datetime objects to ISO format strings for JSON serialization
-        def serialize_datetime(obj):
-            """Convert non-JSON-native objects to serializable primitives."""
-            from datetime import datetime, date
-            from decimal import Decimal
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            if isinstance(obj, Decimal):
-                return float(obj)
-            return obj
-        
-        # Process each row to convert datetime objects
-        serialized_rows = []
-        for row in rows:
-            if isinstance(row, dict):
-                serialized_row = {k: serialize_datetime(v) for k, v in row.items()}
-                serialized_rows.append(serialized_row)
-            else:
-                serialized_rows.append(row)
-                
-        return serialized_rows
+        # Rows keep their driver types; serialize them with _dumps_rows
+        return result.get("rows", [])
+
+    async def _generate_insight(
+        self, id: str, question: str, sql: str, rows: list[Any]
+    ) -> Optional[InsightSummary]:
+        """
+        Ask the diagnosis agent for insights on a query result and store them.
+
+        Args:
+            id: ChatSession ID
+            question: Natural language question the query answers
+            sql: SQL query that produced the rows
+            rows: Query result rows
+
+        Returns:
+            Insight summary, or None if there is no data or diagnosis failed
+        """
+        if not rows:
+            return None
+        try:
+            # Use sample data for insight generation
+            data_sample = _dumps_rows(rows[:20])
+
+            # Identical inputs (dashboard refreshes, retries) reuse the answer
+            cache_key = (
+                question,
+                sql,
+                xxhash.xxh3_128_intdigest(data_sample.encode()),
+            )
+            insight_data = self._diagnosis_cache.get(cache_key)
+            if insight_data is None:
+                logger.debug("Requesting data diagnosis...")
+                agent_resp = await asyncio.to_thread(
+                    self.diagnosis_agent.reply,
+                    id=id,
+                    question=question,
+                    sql=sql,
+                    data_sample=data_sample,
+                )
+
+                insight_data = agent_resp.answer
+                if not isinstance(insight_data, dict):
+                    return None
+                self._diagnosis_cache[cache_key] = insight_data
+
+            # Save to database
+            diagnosis_result = DiagnosisResult(
+                query_id=id,
+                summary=insight_data.get("summary", ""),
+                key_points=insight_data.get("key_points", []),
+            )
+            await self.diagnosis_repo.create(diagnosis_result)
+            return InsightSummary(**insight_data)
+        except Exception as e:
+            logger.warning(f"Failed to generate insight: {e}")
+            return None
 
     async def run_sql(
         self,
@@ -1078,6 +1374,8 @@ class ChatService:
         sql: str,
         timeout: Optional[int] = 30,
         max_rows: Optional[int] = 20,
+        generate_insight: bool = True,
+        encode_rows: bool = True,
     ) -> RunSqlData:
         """
         Run SQL query and return results.
@@ -1088,6 +1386,9 @@ class ChatService:
             sql: SQL query to execute
             timeout: Query timeout in seconds
             max_rows: Maximum number of rows to return
+            generate_insight: Whether to run the diagnosis agent on the result
+            encode_rows: Whether to fill ``data`` with the JSON text of the rows;
+                callers that encode ``rows`` themselves can skip it
 
         Returns:
             Query results and visualization flag
@@ -1102,8 +1403,9 @@ class ChatService:
             question = self.cache.get(id, "question") or "Unknown Question"
             table_schema = self.cache.get(id, "table_schema") or "[]"
             datasource_id = self.cache.get(id, "datasource_id")
-            if isinstance(table_schema, list):
-                table_schema = json.dumps(table_schema, ensure_ascii=False)
+            # Encode once here; the pipeline takes the text as-is
+            if not isinstance(table_schema, str):
+                table_schema = orjson.dumps(table_schema).decode()
 
             # Define execution function for the pipeline
             async def execute_func(query_sql: str):
@@ -1114,11 +1416,8 @@ class ChatService:
                     datasource_id=datasource_id,
                 )
 
-            # Local import to avoid circular dependency
-            from chatbi.pipelines.execution.execution_pipeline import SQLExecutionPipeline
-
             # Initialize pipeline
-            pipeline = SQLExecutionPipeline(
+            pipeline = _sql_execution_pipeline_cls()(
                 sql_agent=self.sql_agent,
                 correction_repo=self.correction_repo,
                 execute_sql_func=execute_func,
@@ -1130,7 +1429,7 @@ class ChatService:
                 query_id=id,
                 initial_sql=sql,
                 question=question,
-                table_schema=table_schema if isinstance(table_schema, str) else str(table_schema)
+                table_schema=table_schema,
             )
 
             logger.debug(f"Query returned {len(serialized_rows)} rows")
@@ -1144,10 +1443,7 @@ class ChatService:
                     "success": True,
                     "error_message": None,
                 }
-                if self.repo.is_async:
-                    await self.repo.save_chat_history(history_data)
-                else:
-                    self.repo.save_chat_history(history_data)
+                await self._record_history(history_data)
             except Exception as e:
                 # Just log the error, don't fail the request
                 logger.error(f"Failed to record SQL execution history: {e}")
@@ -1157,36 +1453,14 @@ class ChatService:
 
             # Generate insights
             insight = None
-            if len(serialized_rows) > 0:
-                try:
-                    # Use sample data for insight generation
-                    sample_rows = serialized_rows[:20]
-                    data_sample = json.dumps(sample_rows, ensure_ascii=False)
-                    
-                    logger.debug("Requesting data diagnosis...")
-                    agent_resp = self.diagnosis_agent.reply(
-                        id=id, 
-                        question=question, 
-                        sql=final_sql, 
-                        data_sample=data_sample
-                    )
-                    
-                    insight_data = agent_resp.answer
-                    if isinstance(insight_data, dict):
-                        # Save to database
-                        diagnosis_result = DiagnosisResult(
-                            query_id=id,
-                            summary=insight_data.get("summary", ""),
-                            key_points=insight_data.get("key_points", [])
-                        )
-                        await self.diagnosis_repo.create(diagnosis_result)
-                        
-                        insight = InsightSummary(**insight_data)
-                except Exception as e:
-                    logger.warning(f"Failed to generate insight: {e}")
+            if generate_insight:
+                insight = await self._generate_insight(
+                    id, question, final_sql, serialized_rows
+                )
 
             return RunSqlData(
-                data=json.dumps(serialized_rows),
+                data=_dumps_rows(serialized_rows) if encode_rows else None,
+                rows=serialized_rows,
                 should_visualize=should_visualize,
                 executed_sql=final_sql,
                 insight=insight,
@@ -1203,7 +1477,7 @@ class ChatService:
                     "success": False,
                     "error_message": str(e),
                 }
-                self.repo.save_chat_history(history_data)
+                await self._record_history(history_data)
             except Exception as log_e:
                 logger.error(f"Failed to record SQL execution error: {log_e}")
 
@@ -1213,7 +1487,7 @@ class ChatService:
             )
 
     @requires_cache(["question", "sql", "table_schema"])
-    def generate_visualize(
+    async def generate_visualize(
         self,
         request: Request,
         id: str,
@@ -1239,8 +1513,13 @@ class ChatService:
             HTTPException: If visualization generation fails
         """
         try:
-            response = self.visualize_agent.reply(
-                id=id, question=question, sql=sql, table_schema=table_schema
+            # The agent call is blocking; keep it off the event loop
+            response = await asyncio.to_thread(
+                self.visualize_agent.reply,
+                id=id,
+                question=question,
+                sql=sql,
+                table_schema=table_schema,
             )
 
             # Cache the visualization config
@@ -1256,15 +1535,26 @@ class ChatService:
                 detail=f"Visualization generation failed: {e!s}",
             )
 
-    def should_visualize(self, df: pd.DataFrame) -> bool:
+    def should_visualize(self, rows: list[dict[str, Any]]) -> bool:
         """
         Determine if data is suitable for visualization.
 
         Args:
-            df: DataFrame with query results
+            rows: Query result rows
 
         Returns:
             True if visualization should be generated
         """
         # Check if there's enough data and numerical columns for visualization
-        return bool(len(df) > 1 and df.select_dtypes(include=["number"]).shape[1] > 0)
+        if len(rows) <= 1:
+            return False
+        # A column's type is decided by its first non-null value, matching how
+        # a numeric dtype would be inferred; stop at the first numeric column
+        for column in rows[0]:
+            for row in rows:
+                value = row.get(column)
+                if value is not None:
+                    if isinstance(value, Number) and not isinstance(value, bool):
+                        return True
+                    break
+        return False
@@ -6,7 +6,10 @@ for database persistence across all domains.
 """
 
 import uuid
+from collections.abc import Callable
 from datetime import datetime
+from functools import cache
+from operator import attrgetter
 from typing import Any, Dict, Optional, Type, TypeVar
 
 from sqlalchemy import Column, DateTime, MetaData, String
@@ -44,6 +47,22 @@ class BaseModel(Base):
 
     __abstract__ = True
 
+    @classmethod
+    @cache
+    def _column_accessors(cls) -> tuple[tuple[str, ...], Callable[[Any], tuple]]:
+        """
+        Column names and a getter returning their values, built once per class.
+
+        Returns:
+            Tuple of (column names, callable mapping an instance to a value tuple)
+        """
+        names = tuple(column.name for column in cls.__table__.columns)
+        if len(names) == 1:
+            # attrgetter with a single name returns the bare value
+            name = names[0]
+            return names, lambda obj: (getattr(obj, name),)
+        return names, attrgetter(*names)
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert model instance to dictionary.
@@ -51,11 +70,8 @@ class BaseModel(Base):
         Returns:
             Dictionary representation of model
         """
-        result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            result[column.name] = value
-        return result
+        names, getter = self._column_accessors()
+        return dict(zip(names, getter(self)))
 
     @classmethod
     def from_dict(cls: type[ModelType], data: dict[str, Any]) -> ModelType:
@@ -98,11 +114,9 @@ class EntityMixin:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert entity to dictionary representation."""
-        result = {}
-        for key, value in self.__dict__.items():
-            if not key.startswith("_"):
-                result[key] = value
-        return result
+        return {
+            key: value for key, value in self.__dict__.items() if not key.startswith("_")
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]):
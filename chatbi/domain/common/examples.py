@@ -0,0 +1,57 @@
+"""
+OpenAPI examples for the common schema models.
+
+Examples are keyed by model name and only merged into a model's JSON schema
+when that schema is generated (OpenAPI docs), never at model build time.
+"""
+
+from typing import Any
+
+_API_INFO_EXAMPLE = {
+    "version": "1.0.0",
+    "response_time_ms": 42.3,
+    "request_id": "abcd1234-5678-efgh-9012",
+}
+
+_PAGINATION_EXAMPLE = {
+    "page": 1,
+    "page_size": 10,
+    "total_items": 100,
+    "total_pages": 10,
+}
+
+SCHEMA_EXAMPLES: dict[str, dict[str, Any]] = {
+    "ErrorModel": {
+        "code": "VALIDATION_ERROR",
+        "message": "Invalid input data",
+        "detail": "The field 'email' must be a valid email address",
+        "source": "validation",
+    },
+    "PaginationModel": _PAGINATION_EXAMPLE,
+    "ApiInfoModel": _API_INFO_EXAMPLE,
+    "LinkModel": {"href": "/api/v1/resources/123", "rel": "self", "method": "GET"},
+    "MetadataModel": {
+        "timestamp": "2025-05-16T12:00:00Z",
+        "api": _API_INFO_EXAMPLE,
+        "pagination": _PAGINATION_EXAMPLE,
+        "links": {
+            "self": {
+                "href": "/api/v1/resources/123",
+                "rel": "self",
+                "method": "GET",
+            },
+            "next": {
+                "href": "/api/v1/resources?page=2",
+                "rel": "next",
+                "method": "GET",
+            },
+        },
+    },
+}
+
+
+def attach_example(schema: dict[str, Any], model: type) -> None:
+    """Merge the registered example for ``model`` into its generated schema."""
+    example = SCHEMA_EXAMPLES.get(model.__name__)
+    if example is not None:
+        schema["example"] = example
@@ -7,13 +7,16 @@ both synchronous and asynchronous database operations through a single interface
 
 import uuid
 from abc import ABC
+from collections.abc import Iterable
+from functools import cache
 from typing import Any, Generic, List, Optional, Type, TypeVar, Union, cast
 
 from loguru import logger
-from sqlalchemy import delete, func, select, update, or_
+from sqlalchemy import bindparam, delete, func, insert, inspect, select, update, or_
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from chatbi.exceptions import DatabaseError, NotFoundError
 
@@ -21,6 +24,29 @@ from chatbi.exceptions import DatabaseError, NotFoundError
 T = TypeVar("T")
 
 
+def _expired_attribute_names(entity: Any) -> list[str]:
+    """
+    Names of attributes the last flush left expired on an entity.
+
+    INSERTs already fetch server defaults through RETURNING, so this is
+    normally empty after a create and only holds SQL-side ``onupdate``
+    columns (e.g. ``updated_at``) after an update.
+    """
+    return list(inspect(entity).expired_attributes)
+
+
+@cache
+def _cascades_deletes(model_class: type) -> bool:
+    """
+    Whether deleting a row of this model has to go through the ORM.
+
+    Relationships declared with ``cascade="delete"`` remove their child rows
+    in Python; the foreign keys carry no ON DELETE rule, so a bare DELETE
+    statement would violate them.
+    """
+    return any(rel.cascade.delete for rel in inspect(model_class).relationships)
+
+
 class BaseRepository(ABC, Generic[T]):
     """
     Unified base repository for database operations.
@@ -29,6 +55,29 @@ class BaseRepository(ABC, Generic[T]):
     session type provided during initialization.
     """
 
+    # Set by each concrete repository
+    model_class: type[T]
+    db: Union[Session, AsyncSession]
+    is_async: bool
+
+    # Loader options (e.g. selectinload(...)) applied by get_many_by_ids
+    # when the caller does not pass its own
+    default_load_options: tuple[LoaderOption, ...] = ()
+
+    # Public methods that only dispatch to an _async_<name>/_sync_<name> pair
+    _DISPATCHED_METHODS = (
+        "get_by_id",
+        "get_many_by_ids",
+        "get_all",
+        "count",
+        "create",
+        "create_many",
+        "insert_many",
+        "update",
+        "update_by_id",
+        "delete",
+    )
+
     def __init__(self, db: Union[Session, AsyncSession]):
         """
         Initialize repository with database session.
@@ -44,115 +93,259 @@ class BaseRepository(ABC, Generic[T]):
         if not hasattr(self, "model_class"):
             raise TypeError("Repository must define 'model_class' attribute")
 
+        # Built once per repository; the statements are immutable and reusable,
+        # with per-call values supplied as bound parameters
+        self._count_stmt = select(func.count()).select_from(self.model_class.__table__)
+        self._by_uuid_stmt = select(self.model_class).where(
+            or_(
+                self.model_class.id == bindparam("id_str"),
+                self.model_class.id == bindparam("id_hex"),
+            )
+        )
+        self._paginate_stmt = (
+            select(self.model_class).offset(bindparam("skip")).limit(bindparam("limit"))
+        )
+
+        if self.is_async:
+            self._specialize_async()
+
+    def _specialize_async(self) -> None:
+        """
+        Bind dispatching public methods straight to their async implementations.
+
+        The session type is fixed for the repository's lifetime, so the
+        is_async branch and the extra coroutine frame of the dispatcher can be
+        resolved once here. Methods a subclass overrides are left alone.
+        """
+        cls = type(self)
+        for name in self._DISPATCHED_METHODS:
+            if getattr(cls, name) is getattr(BaseRepository, name):
+                setattr(self, name, getattr(self, f"_async_{name}"))
+
+    def _id_clause(self, id_value: Any):
+        """Build the primary key filter, matching UUIDs in both string formats."""
+        if isinstance(id_value, uuid.UUID):
+            return or_(
+                self.model_class.id == str(id_value),
+                self.model_class.id == id_value.hex,
+            )
+        return self.model_class.id == id_value
+
+    def _get_many_stmt(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]]
+    ):
+        """Build a single ``WHERE id IN (...)`` select for a batch of IDs."""
+        keys: list[Any] = []
+        for id_value in ids:
+            if isinstance(id_value, uuid.UUID):
+                keys.extend((str(id_value), id_value.hex))
+            else:
+                keys.append(id_value)
+        options = self.default_load_options if load_options is None else load_options
+        return select(self.model_class).where(self.model_class.id.in_(keys)).options(*options)
+
     async def _async_get_by_id(self, id_value: Any) -> Optional[T]:
         """Get entity by ID asynchronously."""
         # Handle UUIDs by checking both string format (with hyphens) and hex format
         if isinstance(id_value, uuid.UUID):
-            query = select(self.model_class).filter(
-                or_(
-                    self.model_class.id == str(id_value),
-                    self.model_class.id == id_value.hex
-                )
+            result = await self.db.execute(
+                self._by_uuid_stmt, {"id_str": str(id_value), "id_hex": id_value.hex}
             )
-        else:
-            query = select(self.model_class).filter(self.model_class.id == id_value)
-        
-        result = await self.db.execute(query)
-        return result.scalars().first()
+            return result.scalars().first()
+
+        # Identity-map lookup; only hits the database on a miss
+        return await self.db.get(self.model_class, id_value)
 
     def _sync_get_by_id(self, id_value: Any) -> Optional[T]:
         """Get entity by ID synchronously."""
         # Handle UUIDs by checking both string format (with hyphens) and hex format
         if isinstance(id_value, uuid.UUID):
-            return self.db.query(self.model_class).filter(
-                or_(
-                    self.model_class.id == str(id_value),
-                    self.model_class.id == id_value.hex
-                )
-            ).first()
-        
-        return self.db.query(self.model_class).get(id_value)
+            return self.db.execute(
+                self._by_uuid_stmt, {"id_str": str(id_value), "id_hex": id_value.hex}
+            ).scalars().first()
+
+        return self.db.get(self.model_class, id_value)
+
+    async def _async_get_many_by_ids(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]] = None
+    ) -> list[T]:
+        """Get entities by a batch of IDs asynchronously."""
+        result = await self.db.execute(self._get_many_stmt(ids, load_options))
+        return list(result.scalars().all())
+
+    def _sync_get_many_by_ids(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]] = None
+    ) -> list[T]:
+        """Get entities by a batch of IDs synchronously."""
+        return list(self.db.execute(self._get_many_stmt(ids, load_options)).scalars().all())
 
     async def _async_get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         """Get all entities with pagination asynchronously."""
         result = await self.db.execute(
-            select(self.model_class).offset(skip).limit(limit)
+            self._paginate_stmt, {"skip": skip, "limit": limit}
         )
         return list(result.scalars().all())
 
     def _sync_get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         """Get all entities with pagination synchronously."""
-        return self.db.query(self.model_class).offset(skip).limit(limit).all()
+        result = self.db.execute(self._paginate_stmt, {"skip": skip, "limit": limit})
+        return list(result.scalars().all())
 
     async def _async_count(self) -> int:
         """Count total number of entities asynchronously."""
-        result = await self.db.execute(
-            select(func.count()).select_from(self.model_class)
-        )
+        result = await self.db.execute(self._count_stmt)
         return result.scalar() or 0
 
     def _sync_count(self) -> int:
         """Count total number of entities synchronously."""
-        return self.db.query(func.count(self.model_class.id)).scalar() or 0
+        return self.db.execute(self._count_stmt).scalar() or 0
 
-    async def _async_create(self, entity: T) -> T:
+    async def _async_create(self, entity: T, refresh: bool = True) -> T:
         """Create new entity asynchronously."""
         try:
             self.db.add(entity)
             await self.db.flush()
-            await self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                await self.db.refresh(entity, attribute_names=expired)
             return entity
         except SQLAlchemyError as e:
             await self.db.rollback()
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to create {self.model_class.__name__}: {e}")
 
-    def _sync_create(self, entity: T) -> T:
+    def _sync_create(self, entity: T, refresh: bool = True) -> T:
         """Create new entity synchronously."""
         try:
             self.db.add(entity)
             self.db.flush()
-            self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                self.db.refresh(entity, attribute_names=expired)
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to create {self.model_class.__name__}: {e}")
 
-    async def _async_update(self, entity: T) -> T:
+    async def _async_create_many(self, entities: list[T]) -> list[T]:
+        """Create several entities with a single flush asynchronously."""
+        try:
+            self.db.add_all(entities)
+            await self.db.flush()
+            return entities
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Error creating {self.model_class.__name__} batch: {e}")
+            raise DatabaseError(f"Failed to create {self.model_class.__name__} batch: {e}")
+
+    def _sync_create_many(self, entities: list[T]) -> list[T]:
+        """Create several entities with a single flush synchronously."""
+        try:
+            self.db.add_all(entities)
+            self.db.flush()
+            return entities
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error creating {self.model_class.__name__} batch: {e}")
+            raise DatabaseError(f"Failed to create {self.model_class.__name__} batch: {e}")
+
+    async def _async_insert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert plain row mappings through Core asynchronously."""
+        if not rows:
+            return
+        try:
+            await self.db.execute(insert(self.model_class.__table__), rows)
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Error inserting {self.model_class.__name__} rows: {e}")
+            raise DatabaseError(f"Failed to insert {self.model_class.__name__} rows: {e}")
+
+    def _sync_insert_many(self, rows: list[dict[str, Any]]) -> None:
+        """Insert plain row mappings through Core synchronously."""
+        if not rows:
+            return
+        try:
+            self.db.execute(insert(self.model_class.__table__), rows)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error inserting {self.model_class.__name__} rows: {e}")
+            raise DatabaseError(f"Failed to insert {self.model_class.__name__} rows: {e}")
+
+    async def _async_update(self, entity: T, refresh: bool = True) -> T:
         """Update existing entity asynchronously."""
         try:
             self.db.add(entity)
             await self.db.flush()
-            await self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                await self.db.refresh(entity, attribute_names=expired)
             return entity
         except SQLAlchemyError as e:
             await self.db.rollback()
             logger.error(f"Error updating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
 
-    def _sync_update(self, entity: T) -> T:
+    def _sync_update(self, entity: T, refresh: bool = True) -> T:
         """Update existing entity synchronously."""
         try:
             self.db.add(entity)
             self.db.flush()
-            self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                self.db.refresh(entity, attribute_names=expired)
             return entity
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error(f"Error updating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
 
+    async def _async_update_by_id(self, id_value: Any, values: dict[str, Any]) -> bool:
+        """Update columns of an entity by ID asynchronously."""
+        try:
+            result = await self.db.execute(
+                update(self.model_class)
+                .where(self._id_clause(id_value))
+                .values(**values)
+                .returning(self.model_class.id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.first() is not None
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            logger.error(f"Error updating {self.model_class.__name__}: {e}")
+            raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
+
+    def _sync_update_by_id(self, id_value: Any, values: dict[str, Any]) -> bool:
+        """Update columns of an entity by ID synchronously."""
+        try:
+            result = self.db.execute(
+                update(self.model_class)
+                .where(self._id_clause(id_value))
+                .values(**values)
+                .returning(self.model_class.id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.first() is not None
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"Error updating {self.model_class.__name__}: {e}")
+            raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
+
     async def _async_delete(self, id_value: Any) -> bool:
         """Delete entity by ID asynchronously."""
         try:
-            # Pass original id_value to _async_get_by_id so it can handle UUIDs correctly
-            entity = await self._async_get_by_id(id_value)
-            if entity:
-                await self.db.delete(entity)
-                await self.db.flush()
-                return True
-            return False
+            if _cascades_deletes(self.model_class):
+                # Pass original id_value to _async_get_by_id so it can handle UUIDs correctly
+                entity = await self._async_get_by_id(id_value)
+                if entity:
+                    await self.db.delete(entity)
+                    await self.db.flush()
+                    return True
+                return False
+            # Single DELETE ... RETURNING instead of loading the row first
+            result = await self.db.execute(
+                delete(self.model_class)
+                .where(self._id_clause(id_value))
+                .returning(self.model_class.id)
+            )
+            return result.first() is not None
         except SQLAlchemyError as e:
             await self.db.rollback()
             logger.error(f"Error deleting {self.model_class.__name__}: {e}")
@@ -161,13 +354,21 @@ class BaseRepository(ABC, Generic[T]):
     def _sync_delete(self, id_value: Any) -> bool:
         """Delete entity by ID synchronously."""
         try:
-            # Pass original id_value to _sync_get_by_id so it can handle UUIDs correctly
-            entity = self._sync_get_by_id(id_value)
-            if entity:
-                self.db.delete(entity)
-                self.db.flush()
-                return True
-            return False
+            if _cascades_deletes(self.model_class):
+                # Pass original id_value to _sync_get_by_id so it can handle UUIDs correctly
+                entity = self._sync_get_by_id(id_value)
+                if entity:
+                    self.db.delete(entity)
+                    self.db.flush()
+                    return True
+                return False
+            # Single DELETE ... RETURNING instead of loading the row first
+            result = self.db.execute(
+                delete(self.model_class)
+                .where(self._id_clause(id_value))
+                .returning(self.model_class.id)
+            )
+            return result.first() is not None
         except SQLAlchemyError as e:
             self.db.rollback()
             logger.error(f"Error deleting {self.model_class.__name__}: {e}")
@@ -210,6 +411,24 @@ class BaseRepository(ABC, Generic[T]):
             raise NotFoundError(f"{model_name} with ID {id_value} not found")
         return entity
 
+    async def get_many_by_ids(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]] = None
+    ) -> list[T]:
+        """
+        Get entities for a batch of IDs in a single query.
+
+        Args:
+            ids: Primary key values
+            load_options: Loader options such as ``selectinload(...)``;
+                defaults to ``default_load_options``
+
+        Returns:
+            Entities found, in database order; missing IDs are skipped
+        """
+        if self.is_async:
+            return await self._async_get_many_by_ids(ids, load_options)
+        return self._sync_get_many_by_ids(ids, load_options)
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         """
         Get all entities with pagination.
@@ -236,33 +455,83 @@ class BaseRepository(ABC, Generic[T]):
             return await self._async_count()
         return self._sync_count()
 
-    async def create(self, entity: T) -> T:
+    async def create(self, entity: T, refresh: bool = True) -> T:
         """
         Create new entity.
 
         Args:
             entity: Entity to create
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Created entity with ID populated
         """
         if self.is_async:
-            return await self._async_create(entity)
-        return self._sync_create(entity)
+            return await self._async_create(entity, refresh)
+        return self._sync_create(entity, refresh)
+
+    async def create_many(self, entities: list[T]) -> list[T]:
+        """
+        Create several entities with a single flush.
+
+        The unit of work batches the INSERTs (executemany / multi-row
+        VALUES) instead of one round trip per entity. Server-generated
+        columns are populated through RETURNING where the dialect allows.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            The same entities, with IDs populated
+        """
+        if self.is_async:
+            return await self._async_create_many(entities)
+        return self._sync_create_many(entities)
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert plain row dictionaries without building ORM entities.
+
+        Goes straight through a Core INSERT executed as executemany, skipping
+        the unit of work. Python-side column defaults still apply, but no
+        entities are returned or added to the session.
+
+        Args:
+            rows: Column names mapped to values, one dict per row
+        """
+        if self.is_async:
+            return await self._async_insert_many(rows)
+        return self._sync_insert_many(rows)
 
-    async def update(self, entity: T) -> T:
+    async def update(self, entity: T, refresh: bool = True) -> T:
         """
         Update existing entity.
 
         Args:
             entity: Entity to update
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Updated entity
         """
         if self.is_async:
-            return await self._async_update(entity)
-        return self._sync_update(entity)
+            return await self._async_update(entity, refresh)
+        return self._sync_update(entity, refresh)
+
+    async def update_by_id(self, id_value: Any, values: dict[str, Any]) -> bool:
+        """
+        Update columns of an entity by ID without loading it first.
+
+        Args:
+            id_value: Primary key value
+            values: Column names mapped to their new values
+
+        Returns:
+            True if updated, False if not found
+        """
+        if self.is_async:
+            return await self._async_update_by_id(id_value, values)
+        return self._sync_update_by_id(id_value, values)
 
     async def delete(self, id_value: Any) -> bool:
         """
@@ -297,6 +566,24 @@ class BaseRepository(ABC, Generic[T]):
             raise ValueError("Cannot use sync methods with async session")
         return self._sync_get_by_id(id_value)
 
+    def get_many_by_ids_sync(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]] = None
+    ) -> list[T]:
+        """
+        Get entities for a batch of IDs synchronously.
+
+        Args:
+            ids: Primary key values
+            load_options: Loader options such as ``selectinload(...)``;
+                defaults to ``default_load_options``
+
+        Returns:
+            Entities found; missing IDs are skipped
+        """
+        if self.is_async:
+            raise ValueError("Cannot use sync methods with async session")
+        return self._sync_get_many_by_ids(ids, load_options)
+
     def get_all_sync(self, skip: int = 0, limit: int = 100) -> list[T]:
         """
         Get all entities with pagination synchronously.
@@ -323,33 +610,75 @@ class BaseRepository(ABC, Generic[T]):
             raise ValueError("Cannot use sync methods with async session")
         return self._sync_count()
 
-    def create_sync(self, entity: T) -> T:
+    def create_sync(self, entity: T, refresh: bool = True) -> T:
         """
         Create new entity synchronously.
 
         Args:
             entity: Entity to create
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Created entity with ID populated
         """
         if self.is_async:
             raise ValueError("Cannot use sync methods with async session")
-        return self._sync_create(entity)
+        return self._sync_create(entity, refresh)
+
+    def create_many_sync(self, entities: list[T]) -> list[T]:
+        """
+        Create several entities with a single flush synchronously.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            The same entities, with IDs populated
+        """
+        if self.is_async:
+            raise ValueError("Cannot use sync methods with async session")
+        return self._sync_create_many(entities)
+
+    def insert_many_sync(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert plain row dictionaries synchronously without building ORM entities.
+
+        Args:
+            rows: Column names mapped to values, one dict per row
+        """
+        if self.is_async:
+            raise ValueError("Cannot use sync methods with async session")
+        self._sync_insert_many(rows)
 
-    def update_sync(self, entity: T) -> T:
+    def update_sync(self, entity: T, refresh: bool = True) -> T:
         """
         Update existing entity synchronously.
 
         Args:
             entity: Entity to update
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Updated entity
         """
         if self.is_async:
             raise ValueError("Cannot use sync methods with async session")
-        return self._sync_update(entity)
+        return self._sync_update(entity, refresh)
+
+    def update_by_id_sync(self, id_value: Any, values: dict[str, Any]) -> bool:
+        """
+        Update columns of an entity by ID synchronously.
+
+        Args:
+            id_value: Primary key value
+            values: Column names mapped to their new values
+
+        Returns:
+            True if updated, False if not found
+        """
+        if self.is_async:
+            raise ValueError("Cannot use sync methods with async session")
+        return self._sync_update_by_id(id_value, values)
 
     def delete_sync(self, id_value: Any) -> bool:
         """
@@ -403,6 +732,14 @@ class AsyncBaseRepository(ABC, Generic[T]):
     # Flag to indicate this repository needs an async session
     uses_async_session = True
 
+    # Set by each concrete repository
+    model_class: type[T]
+    db: AsyncSession
+
+    # Loader options (e.g. selectinload(...)) applied by get_many_by_ids
+    # when the caller does not pass its own
+    default_load_options: tuple[LoaderOption, ...] = ()
+
     def __init__(self, db: AsyncSession):
         """
         Initialize repository with async database session.
@@ -417,6 +754,11 @@ class AsyncBaseRepository(ABC, Generic[T]):
         if not hasattr(self, "model_class"):
             raise TypeError("Repository must define 'model_class' attribute")
 
+        self._count_stmt = select(func.count()).select_from(self.model_class.__table__)
+        self._paginate_stmt = (
+            select(self.model_class).offset(bindparam("skip")).limit(bindparam("limit"))
+        )
+
     async def get_by_id(self, id_value: Any) -> Optional[T]:
         """
         Get entity by ID asynchronously.
@@ -427,10 +769,7 @@ class AsyncBaseRepository(ABC, Generic[T]):
         Returns:
             Entity or None if not found
         """
-        result = await self.db.execute(
-            select(self.model_class).filter(self.model_class.id == id_value)
-        )
-        return result.scalars().first()
+        return await self.db.get(self.model_class, id_value)
 
     async def get_by_id_or_error(self, id_value: Any) -> T:
         """
@@ -451,6 +790,28 @@ class AsyncBaseRepository(ABC, Generic[T]):
             raise NotFoundError(f"{model_name} with ID {id_value} not found")
         return entity
 
+    async def get_many_by_ids(
+        self, ids: Iterable[Any], load_options: Optional[tuple[LoaderOption, ...]] = None
+    ) -> list[T]:
+        """
+        Get entities for a batch of IDs in a single query asynchronously.
+
+        Args:
+            ids: Primary key values
+            load_options: Loader options such as ``selectinload(...)``;
+                defaults to ``default_load_options``
+
+        Returns:
+            Entities found; missing IDs are skipped
+        """
+        options = self.default_load_options if load_options is None else load_options
+        result = await self.db.execute(
+            select(self.model_class)
+            .where(self.model_class.id.in_(list(ids)))
+            .options(*options)
+        )
+        return list(result.scalars().all())
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[T]:
         """
         Get all entities with pagination asynchronously.
@@ -463,7 +824,7 @@ class AsyncBaseRepository(ABC, Generic[T]):
             List of entities
         """
         result = await self.db.execute(
-            select(self.model_class).offset(skip).limit(limit)
+            self._paginate_stmt, {"skip": skip, "limit": limit}
         )
         return list(result.scalars().all())
 
@@ -474,17 +835,16 @@ class AsyncBaseRepository(ABC, Generic[T]):
         Returns:
             Total count
         """
-        result = await self.db.execute(
-            select(func.count()).select_from(self.model_class)
-        )
+        result = await self.db.execute(self._count_stmt)
         return result.scalar() or 0
 
-    async def create(self, entity: T) -> T:
+    async def create(self, entity: T, refresh: bool = True) -> T:
         """
         Create new entity asynchronously.
 
         Args:
             entity: Entity to create
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Created entity with ID populated
@@ -492,19 +852,56 @@ class AsyncBaseRepository(ABC, Generic[T]):
         try:
             self.db.add(entity)
             await self.db.flush()
-            await self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                await self.db.refresh(entity, attribute_names=expired)
             return entity
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error creating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to create {self.model_class.__name__}: {e}")
 
-    async def update(self, entity: T) -> T:
+    async def create_many(self, entities: list[T]) -> list[T]:
+        """
+        Create several entities with a single flush asynchronously.
+
+        Args:
+            entities: Entities to create
+
+        Returns:
+            The same entities, with IDs populated
+        """
+        try:
+            self.db.add_all(entities)
+            await self.db.flush()
+            return entities
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error creating {self.model_class.__name__} batch: {e}")
+            raise DatabaseError(f"Failed to create {self.model_class.__name__} batch: {e}")
+
+    async def insert_many(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert plain row dictionaries asynchronously without building ORM entities.
+
+        Args:
+            rows: Column names mapped to values, one dict per row
+        """
+        if not rows:
+            return
+        try:
+            await self.db.execute(insert(self.model_class.__table__), rows)
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error inserting {self.model_class.__name__} rows: {e}")
+            raise DatabaseError(f"Failed to insert {self.model_class.__name__} rows: {e}")
+
+    async def update(self, entity: T, refresh: bool = True) -> T:
         """
         Update existing entity asynchronously.
 
         Args:
             entity: Entity to update
+            refresh: Reload server-generated columns the flush left expired
 
         Returns:
             Updated entity
@@ -512,13 +909,39 @@ class AsyncBaseRepository(ABC, Generic[T]):
         try:
             self.db.add(entity)
             await self.db.flush()
-            await self.db.refresh(entity)
+            if refresh and (expired := _expired_attribute_names(entity)):
+                await self.db.refresh(entity, attribute_names=expired)
             return entity
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error updating {self.model_class.__name__}: {e}")
             raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
 
+    async def update_by_id(self, id_value: Any, values: dict[str, Any]) -> bool:
+        """
+        Update columns of an entity by ID without loading it first.
+
+        Args:
+            id_value: Primary key value
+            values: Column names mapped to their new values
+
+        Returns:
+            True if updated, False if not found
+        """
+        try:
+            result = await self.db.execute(
+                update(self.model_class)
+                .where(self.model_class.id == id_value)
+                .values(**values)
+                .returning(self.model_class.id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.first() is not None
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error updating {self.model_class.__name__}: {e}")
+            raise DatabaseError(f"Failed to update {self.model_class.__name__}: {e}")
+
     async def delete(self, id_value: Any) -> bool:
         """
         Delete entity by ID asynchronously.
@@ -530,12 +953,19 @@ class AsyncBaseRepository(ABC, Generic[T]):
             True if deleted, False if not found
         """
         try:
-            entity = await self.get_by_id(id_value)
-            if entity:
-                await self.db.delete(entity)
-                await self.db.flush()
-                return True
-            return False
+            if _cascades_deletes(self.model_class):
+                entity = await self.get_by_id(id_value)
+                if entity:
+                    await self.db.delete(entity)
+                    await self.db.flush()
+                    return True
+                return False
+            result = await self.db.execute(
+                delete(self.model_class)
+                .where(self.model_class.id == id_value)
+                .returning(self.model_class.id)
+            )
+            return result.first() is not None
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error deleting {self.model_class.__name__}: {e}")
@@ -5,14 +5,21 @@ This module contains base Pydantic models that are used across different
 domains for consistency and reuse in API requests and responses.
 """
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
+from chatbi.domain.common.examples import attach_example
+
 T = TypeVar("T")
 
 
+def _utc_now() -> datetime:
+    """Current time as an aware UTC datetime (replaces deprecated utcnow)."""
+    return datetime.now(UTC)
+
+
 class ErrorModel(BaseModel):
     """Model representing an API error."""
 
@@ -21,16 +28,7 @@ class ErrorModel(BaseModel):
     detail: Optional[str] = Field(None, description="Detailed error information")
     source: Optional[str] = Field(None, description="Source of the error")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "code": "VALIDATION_ERROR",
-                "message": "Invalid input data",
-                "detail": "The field 'email' must be a valid email address",
-                "source": "validation",
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=attach_example)
 
 
 class PaginationModel(BaseModel):
@@ -41,16 +39,7 @@ class PaginationModel(BaseModel):
     total_items: int = Field(..., description="Total number of items")
     total_pages: int = Field(..., description="Total number of pages")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "page": 1,
-                "page_size": 10,
-                "total_items": 100,
-                "total_pages": 10,
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=attach_example)
 
 
 class ApiInfoModel(BaseModel):
@@ -60,15 +49,7 @@ class ApiInfoModel(BaseModel):
     response_time_ms: float = Field(..., description="Response time in milliseconds")
     request_id: str = Field(..., description="Unique request identifier")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "version": "1.0.0",
-                "response_time_ms": 42.3,
-                "request_id": "abcd1234-5678-efgh-9012",
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=attach_example)
 
 
 class LinkModel(BaseModel):
@@ -80,11 +61,7 @@ class LinkModel(BaseModel):
         "GET", description="HTTP method for accessing the link"
     )
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {"href": "/api/v1/resources/123", "rel": "self", "method": "GET"}
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=attach_example)
 
 
 class MetadataModel(BaseModel):
@@ -96,40 +73,11 @@ class MetadataModel(BaseModel):
     )
     links: Optional[dict[str, LinkModel]] = Field(None, description="HATEOAS links")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=_utc_now, description="Response timestamp"
     )
     extras: Optional[dict[str, Any]] = Field(None, description="Additional metadata")
 
-    model_config = ConfigDict(
-        json_schema_extra={
-            "example": {
-                "timestamp": "2025-05-16T12:00:00Z",
-                "api": {
-                    "version": "1.0.0",
-                    "response_time_ms": 42.3,
-                    "request_id": "abcd1234-5678-efgh-9012",
-                },
-                "pagination": {
-                    "page": 1,
-                    "page_size": 10,
-                    "total_items": 100,
-                    "total_pages": 10,
-                },
-                "links": {
-                    "self": {
-                        "href": "/api/v1/resources/123",
-                        "rel": "self",
-                        "method": "GET",
-                    },
-                    "next": {
-                        "href": "/api/v1/resources?page=2",
-                        "rel": "next",
-                        "method": "GET",
-                    },
-                },
-            }
-        }
-    )
+    model_config = ConfigDict(json_schema_extra=attach_example)
 
 
 class TimeRangeFilter(BaseModel):
@@ -141,7 +89,30 @@ class TimeRangeFilter(BaseModel):
     end_date: Optional[datetime] = Field(None, description="End date for filtering")
 
 
-class StatusResponse(BaseModel):
+class TrustedBuildModel(BaseModel):
+    """
+    Base for response models that are often assembled from already-valid data.
+    """
+
+    @classmethod
+    def build(cls, **data: Any):
+        """
+        Create an instance without running validation.
+
+        Only for trusted code paths where the values are already known to
+        match the field types (e.g. data read back from our own stores);
+        defaults are still applied.
+
+        Args:
+            **data: Field values
+
+        Returns:
+            Model instance
+        """
+        return cls.model_construct(**data)
+
+
+class StatusResponse(TrustedBuildModel):
     """
     Simple status response for operations.
     """
@@ -152,7 +123,7 @@ class StatusResponse(BaseModel):
     )
 
 
-class ValidationError(BaseModel):
+class ValidationError(TrustedBuildModel):
     """
     Detailed validation error information.
     """
@@ -161,7 +132,7 @@ class ValidationError(BaseModel):
     message: str = Field(..., description="Error message")
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(TrustedBuildModel):
     """
     Standard error response structure.
     """
@@ -173,7 +144,7 @@ class ErrorResponse(BaseModel):
     )
 
 
-class MetadataResponse(BaseModel, Generic[T]):
+class MetadataResponse(TrustedBuildModel, Generic[T]):
     """
     Response with metadata structure.
     """
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class CustomerInsightQueryDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class CustomerInsightQueryDTO:
     customer_id: str
 
 
-class SegmentInsightQueryDTO(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SegmentInsightQueryDTO:
     segment_id: str
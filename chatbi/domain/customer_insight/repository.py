@@ -1,20 +1,32 @@
 from __future__ import annotations
 
-import json
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 class CustomerInsightRepository:
+    # Store files already created/seeded in this process
+    _prepared_paths: set[Path] = set()
+
     def __init__(self) -> None:
         base = Path(os.getcwd()) / "runs"
-        base.mkdir(parents=True, exist_ok=True)
         self.path = base / "customer_insight_store.json"
+        # Parsed store and id indexes, reused until the file changes on disk
+        self._cache: dict[str, Any] | None = None
+        self._cache_mtime: int | None = None
+        self._customers_by_id: dict[str, dict[str, Any]] = {}
+        self._segments_by_id: dict[str, dict[str, Any]] = {}
         self._bootstrap()
 
     def _bootstrap(self) -> None:
+        if self.path in self._prepared_paths:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._prepared_paths.add(self.path)
         if self.path.exists():
             return
         now = datetime.utcnow().isoformat()
@@ -81,9 +93,33 @@ class CustomerInsightRepository:
         self.save(data)
 
     def load(self) -> dict[str, Any]:
-        with self.path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        mtime = self.path.stat().st_mtime_ns
+        if self._cache is None or mtime != self._cache_mtime:
+            data = orjson.loads(self.path.read_bytes())
+            self._customers_by_id = {
+                item["customer_id"]: item
+                for item in data.get("customers", [])
+                if "customer_id" in item
+            }
+            self._segments_by_id = {
+                item["segment_id"]: item
+                for item in data.get("segments", [])
+                if "segment_id" in item
+            }
+            self._cache = data
+            self._cache_mtime = mtime
+        return self._cache
+
+    def customers_by_id(self) -> dict[str, dict[str, Any]]:
+        self.load()
+        return self._customers_by_id
+
+    def segments_by_id(self) -> dict[str, dict[str, Any]]:
+        self.load()
+        return self._segments_by_id
 
     def save(self, data: dict[str, Any]) -> None:
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        self.path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        self._cache = None
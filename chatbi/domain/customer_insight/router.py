@@ -1,38 +1,54 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from chatbi.domain.customer_insight.service import CustomerInsightService
 from chatbi.middleware.standard_response import StandardResponse
 
-router = APIRouter(prefix="/api/v1/customer-insight", tags=["Customer Insight"])
+router = APIRouter(
+    prefix="/api/v1/customer-insight",
+    tags=["Customer Insight"],
+    default_response_class=ORJSONResponse,
+)
+
+
+@lru_cache(maxsize=1)
+def get_customer_insight_service() -> CustomerInsightService:
+    return CustomerInsightService()
 
 
 @router.get("/customers")
-async def list_customers() -> StandardResponse[list[dict]]:
-    service = CustomerInsightService()
-    return StandardResponse(status="success", message="Customers fetched", data=service.list_customers())
+async def list_customers(
+    service: CustomerInsightService = Depends(get_customer_insight_service),
+) -> StandardResponse[list[dict]]:
+    return StandardResponse.model_construct(status="success", message="Customers fetched", data=service.list_customers())
 
 
 @router.get("/customers/{customer_id}")
-async def get_customer(customer_id: str) -> StandardResponse[dict]:
-    service = CustomerInsightService()
+async def get_customer(
+    customer_id: str, service: CustomerInsightService = Depends(get_customer_insight_service)
+) -> StandardResponse[dict]:
     item = service.get_customer(customer_id)
     if not item:
         raise HTTPException(status_code=404, detail="Customer not found")
-    return StandardResponse(status="success", message="Customer fetched", data=item)
+    return StandardResponse.model_construct(status="success", message="Customer fetched", data=item)
 
 
 @router.get("/segments")
-async def list_segments() -> StandardResponse[list[dict]]:
-    service = CustomerInsightService()
-    return StandardResponse(status="success", message="Segments fetched", data=service.list_segments())
+async def list_segments(
+    service: CustomerInsightService = Depends(get_customer_insight_service),
+) -> StandardResponse[list[dict]]:
+    return StandardResponse.model_construct(status="success", message="Segments fetched", data=service.list_segments())
 
 
 @router.get("/segments/{segment_id}")
-async def get_segment(segment_id: str) -> StandardResponse[dict]:
-    service = CustomerInsightService()
+async def get_segment(
+    segment_id: str, service: CustomerInsightService = Depends(get_customer_insight_service)
+) -> StandardResponse[dict]:
     item = service.get_segment(segment_id)
     if not item:
         raise HTTPException(status_code=404, detail="Segment not found")
-    return StandardResponse(status="success", message="Segment fetched", data=item)
+    return StandardResponse.model_construct(status="success", message="Segment fetched", data=item)
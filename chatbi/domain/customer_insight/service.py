@@ -1,28 +1,29 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from chatbi.domain.customer_insight.repository import CustomerInsightRepository
 
 
+@lru_cache(maxsize=1)
+def _shared_repository() -> CustomerInsightRepository:
+    # One repository per process so its parsed-store cache outlives a request
+    return CustomerInsightRepository()
+
+
 class CustomerInsightService:
     def __init__(self, repo: CustomerInsightRepository | None = None) -> None:
-        self.repo = repo or CustomerInsightRepository()
+        self.repo = repo or _shared_repository()
 
     def list_customers(self) -> list[dict[str, Any]]:
         return self.repo.load().get("customers", [])
 
     def get_customer(self, customer_id: str) -> dict[str, Any] | None:
-        for item in self.list_customers():
-            if item.get("customer_id") == customer_id:
-                return item
-        return None
+        return self.repo.customers_by_id().get(customer_id)
 
     def list_segments(self) -> list[dict[str, Any]]:
         return self.repo.load().get("segments", [])
 
     def get_segment(self, segment_id: str) -> dict[str, Any] | None:
-        for item in self.list_segments():
-            if item.get("segment_id") == segment_id:
-                return item
-        return None
+        return self.repo.segments_by_id().get(segment_id)
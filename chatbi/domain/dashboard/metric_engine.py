@@ -1,59 +1,121 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Optional
 
-from chatbi.database.connection_manager import connection_manager
-from chatbi.domain.dashboard.indicator_catalog import INDICATOR_DEFINITIONS
-from chatbi.domain.datasource import DatabaseType
+from chatbi.domain.dashboard.indicator_catalog import (
+    INDICATOR_BY_KEY,
+    INDICATOR_SQL_PARTS,
+)
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _quote_literal(val: str) -> str:
+    return "'" + str(val).replace("'", "''") + "'"
+
+
+@lru_cache(maxsize=1024)
+def _in_list(vals: tuple[str, ...]) -> str:
+    # Filter vocabularies (channels, segments, groups) are small and repeat
+    return ",".join(_quote_literal(x) for x in vals)
+
+
+@dataclass(frozen=True, slots=True)
 class MetricFilters:
     start_date: Optional[str] = None
     end_date: Optional[str] = None
-    channels: Optional[list[str]] = None
-    customer_segments: Optional[list[str]] = None
-    customer_groups: Optional[list[str]] = None
+    channels: Optional[tuple[str, ...]] = None
+    customer_segments: Optional[tuple[str, ...]] = None
+    customer_groups: Optional[tuple[str, ...]] = None
     loan_product: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        # Tuples keep instances hashable so they can key the SQL cache
+        for name in ("channels", "customer_segments", "customer_groups"):
+            value = getattr(self, name)
+            if value is not None and not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+
+def _where_suffix(filters: MetricFilters) -> str:
+    if not (
+        filters.start_date
+        or filters.end_date
+        or filters.channels
+        or filters.customer_segments
+        or filters.customer_groups
+        or filters.loan_product
+    ):
+        return ""
+    clauses: list[str] = []
+    if filters.start_date:
+        clauses.append(f"biz_date >= {_quote_literal(filters.start_date)}")
+    if filters.end_date:
+        clauses.append(f"biz_date <= {_quote_literal(filters.end_date)}")
+    if filters.channels:
+        clauses.append(f"channel IN ({_in_list(filters.channels)})")
+    if filters.customer_segments:
+        clauses.append(f"customer_segment IN ({_in_list(filters.customer_segments)})")
+    if filters.customer_groups:
+        clauses.append(f"customer_group IN ({_in_list(filters.customer_groups)})")
+    if filters.loan_product:
+        clauses.append(f"loan_type = {_quote_literal(filters.loan_product)}")
+    if not clauses:
+        return ""
+    return " AND " + " AND ".join(clauses)
+
+
+@lru_cache(maxsize=2048)
+def _build_sql_cached(metric_key: str, filters: MetricFilters) -> str:
+    # Dashboard auto-refresh repeats the same metric/filter pairs
+    parts = INDICATOR_SQL_PARTS.get(metric_key)
+    if not parts:
+        raise ValueError(f"Metric not found: {metric_key}")
+    head, tail = parts
+    return f"{head}{_where_suffix(filters)}{tail}"
+
 
 class MetricEngine:
     def __init__(self) -> None:
-        self.def_map = {x["metric_key"]: x for x in INDICATOR_DEFINITIONS}
-
-    @staticmethod
-    def _quote(val: str) -> str:
-        return "'" + str(val).replace("'", "''") + "'"
-
-    def _build_where_suffix(self, filters: MetricFilters) -> str:
-        clauses: list[str] = []
-        if filters.start_date:
-            clauses.append(f"biz_date >= {self._quote(filters.start_date)}")
-        if filters.end_date:
-            clauses.append(f"biz_date <= {self._quote(filters.end_date)}")
-        if filters.channels:
-            vals = ",".join(self._quote(x) for x in filters.channels)
-            clauses.append(f"channel IN ({vals})")
-        if filters.customer_segments:
-            vals = ",".join(self._quote(x) for x in filters.customer_segments)
-            clauses.append(f"customer_segment IN ({vals})")
-        if filters.customer_groups:
-            vals = ",".join(self._quote(x) for x in filters.customer_groups)
-            clauses.append(f"customer_group IN ({vals})")
-        if filters.loan_product:
-            clauses.append(f"loan_type = {self._quote(filters.loan_product)}")
-        if not clauses:
-            return ""
-        return " AND " + " AND ".join(clauses)
+        self.def_map = INDICATOR_BY_KEY
 
     def build_sql(self, metric_key: str, filters: MetricFilters) -> str:
-        meta = self.def_map.get(metric_key)
-        if not meta:
-            raise ValueError(f"Metric not found: {metric_key}")
-        raw_tpl = meta["sql_template"]
-        suffix = self._build_where_suffix(filters)
-        return raw_tpl.replace(";", f"{suffix};")
+        return _build_sql_cached(metric_key, filters)
+
+    def build_batch_sql(self, metric_keys: list[str], filters: MetricFilters) -> str:
+        # Each metric becomes a scalar subquery so all values come back in one result
+        return (
+            " UNION ALL ".join(
+                f"SELECT {_quote_literal(key)} AS metric_key, "
+                f"({self.build_sql(key, filters).rstrip(';')}) AS metric_value"
+                for key in metric_keys
+            )
+            + ";"
+        )
+
+    async def execute_batch(
+        self,
+        datasource,
+        metric_keys: list[str],
+        filters: MetricFilters,
+    ) -> dict[str, dict[str, Any]]:
+        """Run several metrics in one round trip; returns {key: {"value", "sql"}}."""
+        from chatbi.database.connection_manager import connection_manager
+        from chatbi.domain.datasource import DatabaseType
+
+        result = await connection_manager.execute_query(
+            db_type=DatabaseType(datasource.type),
+            connection_info=datasource.connection_info,
+            query=self.build_batch_sql(metric_keys, filters),
+            timeout=20,
+            max_rows=len(metric_keys),
+        )
+        values = {row.get("metric_key"): row.get("metric_value") for row in result.get("rows", [])}
+        return {
+            key: {"value": values.get(key), "sql": self.build_sql(key, filters)}
+            for key in metric_keys
+        }
 
     async def execute_metric(
         self,
@@ -61,6 +123,10 @@ class MetricEngine:
         metric_key: str,
         filters: MetricFilters,
     ) -> dict[str, Any]:
+        # Deferred so SQL building and catalog lookups do not load the driver stack
+        from chatbi.database.connection_manager import connection_manager
+        from chatbi.domain.datasource import DatabaseType
+
         sql = self.build_sql(metric_key, filters)
         result = await connection_manager.execute_query(
             db_type=DatabaseType(datasource.type),
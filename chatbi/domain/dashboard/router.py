@@ -1,16 +1,26 @@
 from __future__ import annotations
 
-from typing import Optional
-from pydantic import BaseModel, Field
+import hashlib
+from collections.abc import AsyncIterator
+from functools import cache
+from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from loguru import logger
+from pydantic import BaseModel, Field, TypeAdapter
 
-from chatbi.dependencies import RepositoryDependency
+from chatbi.dependencies import JsonBody, RepositoryDependency
 from chatbi.domain.dashboard.service import DashboardService
 from chatbi.domain.datasource.repository import DatasourceRepository
 from chatbi.middleware.standard_response import StandardResponse
 
-router = APIRouter(prefix="/api/v1/dashboard", tags=["Dashboard"])
+router = APIRouter(
+    prefix="/api/v1/dashboard",
+    tags=["Dashboard"],
+    default_response_class=ORJSONResponse,
+)
 DatasourceRepoDep = RepositoryDependency(DatasourceRepository, use_async_session=True)
 
 
@@ -25,23 +35,104 @@ class MetricEngineQueryDTO(BaseModel):
     loan_product: Optional[str] = None
 
 
+# Metric query bodies validated straight from the raw JSON bytes
+MetricQueryBody = JsonBody(TypeAdapter(MetricEngineQueryDTO))
+
+
 @router.get("/loan-kpis")
 async def get_loan_kpis(
+    request: Request,
+    response: Response,
     datasource_id: Optional[str] = Query(None),
+    stream: bool = Query(False, description="Stream metrics then summary as Server-Sent Events"),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[dict]:
     service = DashboardService(datasource_repo=repo)
-    data = await service.get_loan_kpis(datasource_id=datasource_id)
-    return StandardResponse(
+    if stream:
+        # The response body runs after the request's session is closed, so the
+        # datasource is resolved here and the stream only sees plain values
+        events = await service.stream_loan_kpis(datasource_id=datasource_id)
+        return StreamingResponse(
+            _loan_kpi_events(events),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",  # Disable nginx buffering
+            },
+        )
+    data = await service.get_loan_kpis(
+        datasource_id=datasource_id, refresh=_wants_fresh(request)
+    )
+    if cached := _check_etag(request, response, _payload_etag(data), _DYNAMIC_CACHE_CONTROL):
+        return cached
+    return StandardResponse.model_construct(
         status="success",
         message="Loan KPI fetched",
         data=data,
     )
 
 
+async def _loan_kpi_events(events: AsyncIterator[tuple[str, dict[str, Any]]]) -> AsyncIterator[bytes]:
+    try:
+        async for event, payload in events:
+            yield b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+    except Exception as e:
+        logger.error(f"Loan KPI stream failed: {e}")
+        yield b"event: error\ndata: " + orjson.dumps({"content": str(e)}) + b"\n\n"
+    yield b"event: done\ndata: {}\n\n"
+
+
+_STATIC_CACHE_CONTROL = "public, max-age=300"
+
+
+@cache
+def _static_etag(name: str) -> str:
+    # Catalog payloads are module constants, so each ETag is computed once
+    data: Any = (
+        DashboardService.get_metric_catalog()
+        if name == "metric-catalog"
+        else DashboardService.get_indicator_definitions()
+    )
+    return '"' + hashlib.blake2b(orjson.dumps(data), digest_size=8).hexdigest() + '"'
+
+
+def _check_etag(
+    request: Request, response: Response, etag: str, cache_control: str
+) -> Optional[Response]:
+    """Return a 304 when the client already holds ``etag``, else tag ``response``."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def _not_modified(request: Request, response: Response, name: str) -> Optional[Response]:
+    return _check_etag(request, response, _static_etag(name), _STATIC_CACHE_CONTROL)
+
+
+_DYNAMIC_CACHE_CONTROL = "private, max-age=30, must-revalidate"
+
+
+def _payload_etag(data: dict[str, Any]) -> str:
+    # Timings differ on every computation and say nothing about the content
+    body = {k: v for k, v in data.items() if k != "timings"}
+    digest = hashlib.blake2b(
+        orjson.dumps(body, option=orjson.OPT_SORT_KEYS, default=str), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def _wants_fresh(request: Request) -> bool:
+    return "no-cache" in request.headers.get("cache-control", "").lower()
+
+
 @router.get("/metric-catalog")
-async def get_metric_catalog() -> StandardResponse[dict]:
-    return StandardResponse(
+async def get_metric_catalog(request: Request, response: Response) -> StandardResponse[dict]:
+    if cached := _not_modified(request, response, "metric-catalog"):
+        return cached
+    return StandardResponse.model_construct(
         status="success",
         message="Metric catalog fetched",
         data=DashboardService.get_metric_catalog(),
@@ -49,17 +140,21 @@ async def get_metric_catalog() -> StandardResponse[dict]:
 
 
 @router.get("/indicator-definitions")
-async def get_indicator_definitions() -> StandardResponse[list[dict]]:
-    return StandardResponse(
+async def get_indicator_definitions(request: Request, response: Response) -> StandardResponse[list[dict]]:
+    if cached := _not_modified(request, response, "indicator-definitions"):
+        return cached
+    return StandardResponse.model_construct(
         status="success",
         message="Indicator definitions fetched",
         data=DashboardService.get_indicator_definitions(),
     )
 
 
-@router.post("/metric-engine/query")
+@router.post("/metric-engine/query", openapi_extra=MetricQueryBody.openapi_extra)
 async def metric_engine_query(
-    payload: MetricEngineQueryDTO,
+    request: Request,
+    response: Response,
+    payload: MetricEngineQueryDTO = Depends(MetricQueryBody),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[dict]:
     service = DashboardService(datasource_repo=repo)
@@ -73,7 +168,11 @@ async def metric_engine_query(
         customer_groups=payload.customer_groups,
         loan_product=payload.loan_product,
     )
-    return StandardResponse(
+    # POST responses are not stored by shared caches, but a polling client can
+    # still send If-None-Match and skip re-downloading an unchanged result
+    if cached := _check_etag(request, response, _payload_etag(data), _DYNAMIC_CACHE_CONTROL):
+        return cached
+    return StandardResponse.model_construct(
         status="success",
         message="Metric engine query done",
         data=data,
@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import math
+import os
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional
+
+from cachetools import TTLCache
+from loguru import logger
 
 from chatbi.agent.langchain_orchestrator import SmartBILangChainOrchestrator
+from chatbi.database import get_async_session
 from chatbi.database.connection_manager import connection_manager
 from chatbi.domain.ai_config.service import AIConfigService
+from chatbi.domain.dashboard.indicator_catalog import (
+    INDICATOR_DEFINITIONS,
+    INDICATOR_KEYS,
+)
+from chatbi.domain.dashboard.metric_engine import MetricEngine, MetricFilters
 from chatbi.domain.datasource import DatabaseType
 from chatbi.domain.datasource.repository import DatasourceRepository
-from chatbi.domain.dashboard.indicator_catalog import INDICATOR_DEFINITIONS
-from chatbi.domain.dashboard.metric_engine import MetricEngine, MetricFilters
 
+# Caps in-flight metric queries across all requests so a dashboard load
+# cannot drain the datasource connection pool
+_METRIC_SEM = asyncio.Semaphore(int(os.getenv("DASHBOARD_METRIC_CONCURRENCY", "8")))
 
 BUSINESS_LOAN_METRICS = [
     ("bl_register_users", "经营贷注册人数", ""),
@@ -51,27 +71,117 @@ EXTRA_FIN_RISK_METRICS = [
     ("capital_adequacy_ratio", "资本充足率", ""),
 ]
 
+# Built once from the constants above and served as-is; callers only read them
+_METRIC_CATALOG: dict[str, Any] = {
+    "business_loan": [{"key": k, "name": n, "sql": s} for k, n, s in BUSINESS_LOAN_METRICS],
+    "consumer_loan": [{"key": k, "name": n, "sql": s} for k, n, s in CONSUMER_LOAN_METRICS],
+    "finance_risk": [{"key": k, "name": n, "sql": s} for k, n, s in EXTRA_FIN_RISK_METRICS],
+}
+
+_FALLBACK_PAYLOAD: dict[str, Any] = {
+    "datasource_id": None,
+    "business_loan": [{"key": k, "name": n, "value": 0.0} for k, n, _ in BUSINESS_LOAN_METRICS],
+    "consumer_loan": [{"key": k, "name": n, "value": 0.0} for k, n, _ in CONSUMER_LOAN_METRICS],
+    "finance_risk": [{"key": k, "name": n, "value": 0.0} for k, n, _ in EXTRA_FIN_RISK_METRICS],
+    "summary": "当前未检测到可用数据源，已返回默认指标模板。",  # noqa: RUF001
+}
+
+# Snapshots with fewer non-zero metrics get a templated summary, not an LLM call
+_MIN_METRICS_FOR_LLM_SUMMARY = 3
+
+
+@contextmanager
+def _span(name: str, timings: dict[str, float]) -> Iterator[None]:
+    # Wall time of the block in milliseconds, recorded even when it raises
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter_ns() - start) / 1e6, 3)
+
+
+def _format_metric_value(value: Any) -> str:
+    # Fractional values are cut to 4 decimals so the LLM prompt does not
+    # carry full float reprs; counts and amounts keep every integer digit
+    if isinstance(value, (float, Decimal)) and math.isfinite(value):
+        text = f"{value:.4f}".rstrip("0").rstrip(".")
+        return "0" if text == "-0" else text
+    return str(value)
+
+
+@lru_cache(maxsize=1)
+def _shared_components() -> tuple[AIConfigService, SmartBILangChainOrchestrator, MetricEngine]:
+    # Request-independent collaborators, built once per process; only the
+    # datasource repository is bound to the request session
+    return AIConfigService(), SmartBILangChainOrchestrator(), MetricEngine()
+
+
+@dataclass(slots=True)
+class MetricItem:
+    """One KPI entry of a /loan-kpis metric group."""
+
+    key: str
+    name: str
+    value: Any
+    sql: Optional[str] = None
+
+
+class _DatasourceRef(NamedTuple):
+    """Fields of a datasource that metric execution needs."""
+
+    id: Any
+    type: Any
+    connection_info: Any
+
 
 class DashboardService:
+    # Resolved datasource per requested id (None = default pick); repeated
+    # dashboard refreshes skip the repository round trip
+    _datasource_cache: TTLCache = TTLCache(maxsize=256, ttl=30)
+    # Computed /loan-kpis payloads as (monotonic computed_at, payload), keyed by
+    # ("kpis", datasource_id, day); entries past _KPI_FRESH_SECONDS are served
+    # once more while a background refresh replaces them
+    _kpi_cache: TTLCache = TTLCache(maxsize=64, ttl=300)
+    _KPI_FRESH_SECONDS = 60
+    # In-flight computations (request misses and background refreshes) by
+    # cache key; concurrent callers await the same task
+    _kpi_inflight: dict[tuple, asyncio.Task] = {}
+
     def __init__(self, datasource_repo: DatasourceRepository):
         self.datasource_repo = datasource_repo
-        self.ai_config_service = AIConfigService()
-        self.lc_orchestrator = SmartBILangChainOrchestrator()
-        self.metric_engine = MetricEngine()
+        self.ai_config_service, self.lc_orchestrator, self.metric_engine = _shared_components()
 
     async def _resolve_datasource(self, datasource_id: Optional[str]):
+        cached = self._datasource_cache.get(datasource_id)
+        if cached is not None:
+            return cached
+        ds = await self._lookup_datasource(datasource_id)
+        if ds is None:
+            return None
+        ref = _DatasourceRef(id=ds.id, type=ds.type, connection_info=ds.connection_info)
+        self._datasource_cache[datasource_id] = ref
+        return ref
+
+    async def _lookup_datasource(self, datasource_id: Optional[str]):
         if datasource_id:
             ds = await self.datasource_repo.get_by_id(datasource_id)
             if ds:
                 return ds
-        all_ds = await self.datasource_repo.get_all(limit=100)
-        if not all_ds:
-            return None
-        for ds in all_ds:
-            ds_type = ds.type.value if hasattr(ds.type, "value") else str(ds.type)
-            if "duckdb" in ds_type.lower():
-                return ds
-        return all_ds[0]
+        ds = await self.datasource_repo.find_first_by_type_substring("duckdb")
+        if ds:
+            return ds
+        all_ds = await self.datasource_repo.get_all(limit=1)
+        return all_ds[0] if all_ds else None
+
+    async def _execute_metric_guarded(
+        self, datasource, metric_key: str, filters: MetricFilters
+    ) -> dict[str, Any]:
+        async with _METRIC_SEM:
+            return await self.metric_engine.execute_metric(
+                datasource=datasource,
+                metric_key=metric_key,
+                filters=filters,
+            )
 
     async def _run_metric_sql(self, datasource, sql: str) -> Optional[float]:
         try:
@@ -93,39 +203,155 @@ class DashboardService:
         except Exception:
             return None
 
-    async def get_loan_kpis(self, datasource_id: Optional[str] = None) -> dict[str, Any]:
-        datasource = await self._resolve_datasource(datasource_id)
+    async def _collect_loan_kpis(
+        self, datasource, timings: dict[str, float]
+    ) -> list[list[MetricItem]]:
+        default_filters = MetricFilters()
+
+        async def collect(group: str, metrics):
+            keys = [key for key, _name, _sql in metrics]
+            with _span(f"sql.{group}", timings):
+                try:
+                    async with _METRIC_SEM:
+                        by_key = await self.metric_engine.execute_batch(datasource, keys, default_filters)
+                except Exception as e:
+                    logger.warning(f"Batched metric query failed, running metrics one by one: {e}")
+                    results = await asyncio.gather(
+                        *[self._execute_metric_guarded(datasource, key, default_filters) for key in keys]
+                    )
+                    by_key = dict(zip(keys, results))
+            return [
+                MetricItem(key=key, name=name, value=by_key[key]["value"], sql=by_key[key]["sql"])
+                for key, name, _sql in metrics
+            ]
+
+        with _span("sql", timings):
+            return await asyncio.gather(
+                collect("business_loan", BUSINESS_LOAN_METRICS),
+                collect("consumer_loan", CONSUMER_LOAN_METRICS),
+                collect("finance_risk", EXTRA_FIN_RISK_METRICS),
+            )
+
+    @staticmethod
+    def _metrics_text(*groups: list[MetricItem]) -> str:
+        return "\n".join(
+            f"{x.name}: {_format_metric_value(x.value)}" for group in groups for x in group
+        )
+
+    @staticmethod
+    def _kpi_cache_key(datasource_id: Optional[str]) -> tuple:
+        return ("kpis", datasource_id, date.today().isoformat())
+
+    @staticmethod
+    def _template_summary(*groups: list[MetricItem]) -> Optional[str]:
+        """Deterministic summary for near-empty snapshots, None when the LLM should write one."""
+        filled = [x for group in groups for x in group if x.value]
+        if not filled:
+            return "当前数据源暂无有效指标数据，已返回默认指标模板。"  # noqa: RUF001
+        if len(filled) < _MIN_METRICS_FOR_LLM_SUMMARY:
+            listed = "；".join(f"{x.name}: {_format_metric_value(x.value)}" for x in filled)  # noqa: RUF001
+            return f"当前仅{len(filled)}项指标有数据：{listed}。"  # noqa: RUF001
+        return None
+
+    async def get_loan_kpis(
+        self, datasource_id: Optional[str] = None, refresh: bool = False
+    ) -> dict[str, Any]:
+        key = self._kpi_cache_key(datasource_id)
+        # refresh skips the cached payload (client sent Cache-Control: no-cache)
+        cached = None if refresh else self._kpi_cache.get(key)
+        if cached is not None:
+            computed_at, payload = cached
+            if time.monotonic() - computed_at >= self._KPI_FRESH_SECONDS:
+                schedule_loan_kpi_refresh(datasource_id)
+            return payload
+
+        # The computation is shared by concurrent callers and can outlive this
+        # request, so it runs on its own session rather than on this one
+        task = schedule_loan_kpi_refresh(datasource_id)
+        # Shielded so one caller going away does not cancel the shared work
+        return await asyncio.shield(task)
+
+    async def _compute_and_store_loan_kpis(
+        self, datasource_id: Optional[str], key: tuple
+    ) -> dict[str, Any]:
+        payload = await self._compute_loan_kpis(datasource_id)
+        self._store_loan_kpis(key, payload)
+        return payload
+
+    @classmethod
+    def _store_loan_kpis(cls, key: tuple, payload: dict[str, Any]) -> None:
+        # The no-datasource template is not cached so a new datasource shows up at once
+        if payload.get("datasource_id") is not None:
+            cls._kpi_cache[key] = (time.monotonic(), payload)
+
+    async def _compute_loan_kpis(self, datasource_id: Optional[str]) -> dict[str, Any]:
+        timings: dict[str, float] = {}
+        with _span("resolve_datasource", timings):
+            datasource = await self._resolve_datasource(datasource_id)
         if not datasource:
             return self._fallback_payload()
 
-        default_filters = MetricFilters()
-
-        async def collect(metrics):
-            items = []
-            for key, name, _sql in metrics:
-                result = await self.metric_engine.execute_metric(
-                    datasource=datasource,
-                    metric_key=key,
-                    filters=default_filters,
+        business, consumer, extra = await self._collect_loan_kpis(datasource, timings)
+        with _span("summary", timings):
+            summary = self._template_summary(business, consumer, extra)
+            if summary is None:
+                # The LLM call is blocking; keep it off the event loop
+                summary = await asyncio.to_thread(
+                    self.lc_orchestrator.summarize_for_dashboard,
+                    llm_cfg=self.ai_config_service.resolve_llm_source(scene="dashboard"),
+                    metrics_text=self._metrics_text(business, consumer, extra),
                 )
-                items.append({"key": key, "name": name, "value": result["value"], "sql": result["sql"]})
-            return items
-
-        business = await collect(BUSINESS_LOAN_METRICS)
-        consumer = await collect(CONSUMER_LOAN_METRICS)
-        extra = await collect(EXTRA_FIN_RISK_METRICS)
-        metrics_text = "\n".join([f"{x['name']}: {x['value']}" for x in business + consumer + extra])
-        summary = self.lc_orchestrator.summarize_for_dashboard(
-            llm_cfg=self.ai_config_service.resolve_llm_source(scene="dashboard"),
-            metrics_text=metrics_text,
-        )
+        logger.debug(f"Loan KPI timings (ms): {timings}")
         return {
             "datasource_id": str(datasource.id),
             "business_loan": business,
             "consumer_loan": consumer,
             "finance_risk": extra,
             "summary": summary,
+            "timings": timings,
+        }
+
+    async def stream_loan_kpis(
+        self, datasource_id: Optional[str] = None
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Resolve the datasource, then return the (event, payload) stream for it.
+
+        A streamed response body runs after the request's session is closed,
+        so the repository is only used here; the returned iterator works on
+        the resolved datasource alone.
+        """
+        timings: dict[str, float] = {}
+        with _span("resolve_datasource", timings):
+            datasource = await self._resolve_datasource(datasource_id)
+        return self._loan_kpi_events(datasource, timings)
+
+    async def _loan_kpi_events(
+        self, datasource: Optional[_DatasourceRef], timings: dict[str, float]
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Yield (event, payload) pairs: the metric groups first, then summary chunks."""
+        if not datasource:
+            fallback = self._fallback_payload()
+            yield "metrics", {k: v for k, v in fallback.items() if k != "summary"}
+            yield "summary", {"delta": fallback["summary"]}
+            return
+
+        business, consumer, extra = await self._collect_loan_kpis(datasource, timings)
+        yield "metrics", {
+            "datasource_id": str(datasource.id),
+            "business_loan": business,
+            "consumer_loan": consumer,
+            "finance_risk": extra,
+            "timings": timings,
         }
+        summary = self._template_summary(business, consumer, extra)
+        if summary is not None:
+            yield "summary", {"delta": summary}
+            return
+        async for delta in self.lc_orchestrator.summarize_for_dashboard_stream(
+            llm_cfg=self.ai_config_service.resolve_llm_source(scene="dashboard"),
+            metrics_text=self._metrics_text(business, consumer, extra),
+        ):
+            yield "summary", {"delta": delta}
 
     async def query_metrics_with_filters(
         self,
@@ -138,7 +364,9 @@ class DashboardService:
         customer_groups: Optional[list[str]],
         loan_product: Optional[str],
     ) -> dict[str, Any]:
-        datasource = await self._resolve_datasource(datasource_id)
+        timings: dict[str, float] = {}
+        with _span("resolve_datasource", timings):
+            datasource = await self._resolve_datasource(datasource_id)
         if not datasource:
             return {"datasource_id": None, "items": [], "message": "No datasource available"}
 
@@ -150,38 +378,65 @@ class DashboardService:
             customer_groups=customer_groups,
             loan_product=loan_product,
         )
-        items = []
-        for key in metric_keys:
+
+        async def run(key: str) -> dict[str, Any]:
+            if key not in INDICATOR_KEYS:
+                # Same shape as an execution error, without raising for it
+                return {"metric_key": key, "error": f"Metric not found: {key}"}
             try:
-                items.append(
-                    await self.metric_engine.execute_metric(
-                        datasource=datasource,
-                        metric_key=key,
-                        filters=filters,
-                    )
-                )
+                return await self._execute_metric_guarded(datasource, key, filters)
             except Exception as e:
-                items.append({"metric_key": key, "error": str(e)})
-        return {"datasource_id": str(datasource.id), "filters": filters.__dict__, "items": items}
+                return {"metric_key": key, "error": str(e)}
 
-    @staticmethod
-    def _fallback_payload() -> dict[str, Any]:
+        with _span("sql", timings):
+            items = list(await asyncio.gather(*[run(key) for key in metric_keys]))
+        logger.debug(f"Metric query timings (ms): {timings}")
         return {
-            "datasource_id": None,
-            "business_loan": [{"key": k, "name": n, "value": 0.0} for k, n, _ in BUSINESS_LOAN_METRICS],
-            "consumer_loan": [{"key": k, "name": n, "value": 0.0} for k, n, _ in CONSUMER_LOAN_METRICS],
-            "finance_risk": [{"key": k, "name": n, "value": 0.0} for k, n, _ in EXTRA_FIN_RISK_METRICS],
-            "summary": "当前未检测到可用数据源，已返回默认指标模板。",
+            "datasource_id": str(datasource.id),
+            "filters": asdict(filters),
+            "items": items,
+            "timings": timings,
         }
 
+    @staticmethod
+    def _fallback_payload() -> dict[str, Any]:
+        return _FALLBACK_PAYLOAD
+
     @staticmethod
     def get_metric_catalog() -> dict[str, Any]:
-        return {
-            "business_loan": [{"key": k, "name": n, "sql": s} for k, n, s in BUSINESS_LOAN_METRICS],
-            "consumer_loan": [{"key": k, "name": n, "sql": s} for k, n, s in CONSUMER_LOAN_METRICS],
-            "finance_risk": [{"key": k, "name": n, "sql": s} for k, n, s in EXTRA_FIN_RISK_METRICS],
-        }
+        return _METRIC_CATALOG
 
     @staticmethod
     def get_indicator_definitions() -> list[dict[str, Any]]:
         return INDICATOR_DEFINITIONS
+
+
+def _track_kpi_task(key: tuple, coro) -> asyncio.Task:
+    task = asyncio.create_task(coro)
+    DashboardService._kpi_inflight[key] = task
+
+    def done(t: asyncio.Task) -> None:
+        DashboardService._kpi_inflight.pop(key, None)
+        # Retrieving the exception here keeps unawaited refreshes from
+        # warning at shutdown; awaiting callers still get it raised
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"Loan KPI computation failed: {t.exception()}")
+
+    task.add_done_callback(done)
+    return task
+
+
+async def _refresh_loan_kpis(datasource_id: Optional[str], key: tuple) -> dict[str, Any]:
+    # Runs outside any request, so it opens its own session
+    async with get_async_session() as session:
+        service = DashboardService(datasource_repo=DatasourceRepository(session))
+        return await service._compute_and_store_loan_kpis(datasource_id, key)
+
+
+def schedule_loan_kpi_refresh(datasource_id: Optional[str] = None) -> asyncio.Task:
+    """Recompute the cached /loan-kpis payload in the background; also used to pre-warm at startup."""
+    key = DashboardService._kpi_cache_key(datasource_id)
+    pending = DashboardService._kpi_inflight.get(key)
+    if pending is not None:
+        return pending
+    return _track_kpi_task(key, _refresh_loan_kpis(datasource_id, key))
@@ -5,12 +5,17 @@ This module contains the core domain models and business logic for data source m
 """
 
 from chatbi.domain.datasource.dtos import (
+    # Connection info DTOs and request body adapters
+    CONNECTION_INFO_BY_TYPE,
+    DATASOURCE_CREATE_ADAPTER,
+    DATASOURCE_TEST_CONNECTION_ADAPTER,
+    DATASOURCE_UPDATE_ADAPTER,
+    QUERY_REQUEST_ADAPTER,
     AnalyzeSQLBatchDTO,
     AnalyzeSQLDTO,
     BigQueryConnectionInfo,
     ClickHouseConnectionInfo,
     ColumnMetadata,
-    # Connection info DTOs
     ConnectionInfo,
     ConnectionUrl,
     DatabaseType,
@@ -95,6 +100,7 @@ __all__ = [
     "ColumnType",
     "DatabaseSchema",
     # Connection info DTOs
+    "CONNECTION_INFO_BY_TYPE",
     "ConnectionInfo",
     "ConnectionUrl",
     "DuckDbConnectionInfo",
@@ -136,4 +142,9 @@ __all__ = [
     "AnalyzeSQLDTO",
     "AnalyzeSQLBatchDTO",
     "DryPlanDTO",
+    # Request body adapters
+    "DATASOURCE_CREATE_ADAPTER",
+    "DATASOURCE_UPDATE_ADAPTER",
+    "DATASOURCE_TEST_CONNECTION_ADAPTER",
+    "QUERY_REQUEST_ADAPTER",
 ]
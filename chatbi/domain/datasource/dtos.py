@@ -12,7 +12,16 @@ from enum import Enum
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    SecretStr,
+    TypeAdapter,
+    field_validator,
+)
+from typing_extensions import TypedDict
 
 # Common fields used across models
 manifest_str_field = Field(alias="manifestStr", description="Base64 manifest")
@@ -321,6 +330,19 @@ ConnectionInfo = Union[
     TrinoConnectionInfo,
 ]
 
+# Connection info model for each database type, used to build a typed
+# ConnectionInfo from a stored config dict with a single lookup
+CONNECTION_INFO_BY_TYPE: dict[DatabaseType, type[BaseModel]] = {
+    DatabaseType.POSTGRES: PostgresConnectionInfo,
+    DatabaseType.MYSQL: MySqlConnectionInfo,
+    DatabaseType.DUCKDB: DuckDbConnectionInfo,
+    DatabaseType.MSSQL: MSSqlConnectionInfo,
+    DatabaseType.CLICKHOUSE: ClickHouseConnectionInfo,
+    DatabaseType.BIGQUERY: BigQueryConnectionInfo,
+    DatabaseType.SNOWFLAKE: SnowflakeConnectionInfo,
+    DatabaseType.TRINO: TrinoConnectionInfo,
+}
+
 
 # Connection testing models
 class DataSourceTestConnection(BaseModel):
@@ -349,26 +371,12 @@ class DataSourceTestConnection(BaseModel):
         }
     )
 
-    def get_connection_info(self) -> Any:
+    def get_connection_info(self) -> BaseModel:
         """Convert generic connection info to specific type"""
-        if self.type == DatabaseType.POSTGRES:
-            return PostgresConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.MYSQL:
-            return MySqlConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.DUCKDB:
-            return DuckDbConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.MSSQL:
-            return MSSqlConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.CLICKHOUSE:
-            return ClickHouseConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.BIGQUERY:
-            return BigQueryConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.SNOWFLAKE:
-            return SnowflakeConnectionInfo(**self.connection_info)
-        elif self.type == DatabaseType.TRINO:
-            return TrinoConnectionInfo(**self.connection_info)
-        else:
+        info_cls = CONNECTION_INFO_BY_TYPE.get(self.type)
+        if info_cls is None:
             raise ValueError(f"Unsupported database type: {self.type}")
+        return info_cls.model_validate(self.connection_info)
 
 
 class DataSourceTestResponse(BaseModel):
@@ -509,46 +517,57 @@ class QueryError(BaseModel):
 
 
 # Schema models
+# Upper-cased string values read as "nullable"; Y/T cover single-letter flags
+_TRUTHY_NULLABLE: frozenset[str] = frozenset({"YES", "TRUE", "1", "Y", "T"})
+
+
+class ForeignKeyRef(TypedDict):
+    """Column referenced by a foreign key"""
+
+    table: str
+    column: str
+
+
 class ColumnMetadata(BaseModel):
     """Model for database column metadata"""
 
     name: str = Field(..., description="Column name")
-    type: str = Field(..., description="Data type of the column")
-    nullable: bool = Field(..., description="Whether the column allows NULL values")
+    # Aliases accept the raw driver/information_schema key names; pydantic-core
+    # resolves them without a Python-level remapping hook per column
+    type: str = Field(
+        ...,
+        description="Data type of the column",
+        validation_alias=AliasChoices("type", "data_type"),
+    )
+    nullable: bool = Field(
+        ...,
+        description="Whether the column allows NULL values",
+        validation_alias=AliasChoices("nullable", "is_nullable"),
+    )
     primary_key: bool = Field(
-        False, description="Whether the column is part of the primary key"
+        False,
+        description="Whether the column is part of the primary key",
+        validation_alias=AliasChoices("primary_key", "is_primary_key"),
     )
-    foreign_key: Optional[dict[str, str]] = Field(
+    foreign_key: Optional[ForeignKeyRef] = Field(
         None, description="Foreign key reference if applicable (table and column)"
     )
     description: Optional[str] = Field(None, description="Column description/comment")
 
-    @model_validator(mode="before")
+    @field_validator("nullable", mode="before")
+    @classmethod
+    def parse_nullable(cls, value: Any) -> bool:
+        # information_schema reports is_nullable as 'YES'/'NO'; drivers may
+        # also send None or 0/1, which coerce like bool()
+        if isinstance(value, str):
+            return value.upper() in _TRUTHY_NULLABLE
+        return bool(value)
+
+    @field_validator("primary_key", mode="before")
     @classmethod
-    def map_fields(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            # Map data_type to type
-            if "type" not in data and "data_type" in data:
-                data["type"] = data["data_type"]
-
-            # Map is_nullable to nullable
-            if "nullable" not in data and "is_nullable" in data:
-                val = data["is_nullable"]
-                if isinstance(val, str):
-                    data["nullable"] = val.upper() in ["YES", "TRUE", "1"]
-                else:
-                    data["nullable"] = bool(val)
-            
-            # Map is_primary_key to primary_key
-            if "primary_key" not in data and "is_primary_key" in data:
-                data["primary_key"] = bool(data["is_primary_key"])
-
-            # Ensure primary_key and foreign_key have defaults if missing
-            if "primary_key" not in data:
-                data["primary_key"] = False
-            if "foreign_key" not in data:
-                data["foreign_key"] = None
-        return data
+    def parse_primary_key(cls, value: Any) -> bool:
+        # Drivers report None for non-key columns
+        return bool(value)
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -583,7 +602,9 @@ class TableMetadata(BaseModel):
 
     name: str = Field(..., description="Table name")
     schema_name: Optional[str] = Field(
-        None, description="Schema name containing the table"
+        None,
+        description="Schema name containing the table",
+        validation_alias=AliasChoices("schema_name", "schema"),
     )
     description: Optional[str] = Field(None, description="Table description/comment")
     columns: list[ColumnMetadata] = Field(..., description="Columns in the table")
@@ -591,14 +612,6 @@ class TableMetadata(BaseModel):
         None, description="Indexes on the table"
     )
 
-    @model_validator(mode="before")
-    @classmethod
-    def map_schema_name(cls, data: Any) -> Any:
-        if isinstance(data, dict):
-            if "schema_name" not in data and "schema" in data:
-                data["schema_name"] = data["schema"]
-        return data
-
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -736,6 +749,23 @@ class DryPlanDTO(BaseModel):
 
 
 # Metrics models
+class RecentQuery(TypedDict):
+    """Entry in QueryMetrics.recent_queries"""
+
+    id: UUID
+    sql: str
+    status: str
+    duration_ms: int
+    executed_at: datetime
+
+
+class HourBucket(TypedDict):
+    """Entry in UsageMetrics.connections_per_hour"""
+
+    hour: datetime
+    count: int
+
+
 class QueryMetrics(BaseModel):
     """Model for query execution metrics"""
 
@@ -750,7 +780,7 @@ class QueryMetrics(BaseModel):
         ..., description="Minimum query execution time in milliseconds"
     )
     error_rate: float = Field(..., description="Query error rate as percentage")
-    recent_queries: list[dict[str, Any]] = Field(
+    recent_queries: list[RecentQuery] = Field(
         ..., description="Recent query history"
     )
 
@@ -786,7 +816,7 @@ class UsageMetrics(BaseModel):
     avg_connection_duration_ms: float = Field(
         ..., description="Average connection duration in milliseconds"
     )
-    connections_per_hour: list[dict[str, Any]] = Field(
+    connections_per_hour: list[HourBucket] = Field(
         ..., description="Connections per hour over time"
     )
 
@@ -1018,3 +1048,13 @@ class SystemHealthResponse(BaseModel):
             }
         }
     )
+
+
+# Request body adapters, built once at import so route dependencies reuse the
+# same core schema for every request (see chatbi.dependencies.JsonBody)
+DATASOURCE_CREATE_ADAPTER: TypeAdapter[DataSourceCreate] = TypeAdapter(DataSourceCreate)
+DATASOURCE_UPDATE_ADAPTER: TypeAdapter[DataSourceUpdate] = TypeAdapter(DataSourceUpdate)
+DATASOURCE_TEST_CONNECTION_ADAPTER: TypeAdapter[DataSourceTestConnection] = TypeAdapter(
+    DataSourceTestConnection
+)
+QUERY_REQUEST_ADAPTER: TypeAdapter[QueryRequest] = TypeAdapter(QueryRequest)
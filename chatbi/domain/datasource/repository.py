@@ -113,12 +113,33 @@ class DatasourceRepository(BaseRepository[Datasource]):
         Returns:
             Datasource if found, None otherwise
         """
+        query = select(self.model_class).where(self.model_class.name == name)
         if self.is_async:
-            query = select(self.model_class).where(self.model_class.name == name)
             result = await self.db.execute(query)
-            return result.scalars().first()
         else:
-            return self.db.query(self.model_class).filter(self.model_class.name == name).first()
+            result = self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def find_first_by_type_substring(self, substr: str) -> Optional[Datasource]:
+        """
+        Get the first datasource whose type contains a substring (case-insensitive).
+
+        Args:
+            substr: Substring to look for in the datasource type
+
+        Returns:
+            Matching datasource if any, None otherwise
+        """
+        query = (
+            select(self.model_class)
+            .where(func.lower(self.model_class.type).like(f"%{substr.lower()}%"))
+            .limit(1)
+        )
+        if self.is_async:
+            result = await self.db.execute(query)
+        else:
+            result = self.db.execute(query)
+        return result.scalars().first()
 
     async def update_datasource_last_used(self, datasource_id: str) -> bool:
         """
@@ -10,15 +10,20 @@ from typing import Any, Dict, List, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
 from loguru import logger
-from pydantic import UUID4
+from pydantic import UUID4, TypeAdapter
 
 from chatbi.dependencies import (
     AsyncSessionDep,
+    JsonBody,
     PostgresSessionDep,
     RepositoryDependency,
     transactional,
 )
 from chatbi.domain.datasource import (
+    DATASOURCE_CREATE_ADAPTER,
+    DATASOURCE_TEST_CONNECTION_ADAPTER,
+    DATASOURCE_UPDATE_ADAPTER,
+    QUERY_REQUEST_ADAPTER,
     DatabaseType,
     DataSourceCreate,
     DataSourceListResponse,
@@ -45,6 +50,25 @@ router = APIRouter(prefix="/api/v1/datasources", tags=["datasources"])
 # Create repository dependency
 DatasourceRepoDep = RepositoryDependency(DatasourceRepository)
 
+# Request bodies validated straight from the raw JSON bytes
+CreateBody = JsonBody(DATASOURCE_CREATE_ADAPTER)
+UpdateBody = JsonBody(DATASOURCE_UPDATE_ADAPTER)
+TestConnectionBody = JsonBody(DATASOURCE_TEST_CONNECTION_ADAPTER)
+QueryBody = JsonBody(QUERY_REQUEST_ADAPTER)
+
+# Response envelopes for the listing endpoints, built once at import; handlers
+# dump through these directly instead of FastAPI re-validating the returned
+# model against response_model and serializing it on every request
+_LIST_RESPONSE_ADAPTER: TypeAdapter[StandardResponse[DataSourceListResponse]] = TypeAdapter(
+    StandardResponse[DataSourceListResponse]
+)
+_SCHEMA_METADATA_ADAPTER: TypeAdapter[StandardResponse[SchemaMetadata]] = TypeAdapter(
+    StandardResponse[SchemaMetadata]
+)
+_QUERY_RESULT_ADAPTER: TypeAdapter[StandardResponse[QueryResult]] = TypeAdapter(
+    StandardResponse[QueryResult]
+)
+
 
 @router.post(
     "",
@@ -52,10 +76,11 @@ DatasourceRepoDep = RepositoryDependency(DatasourceRepository)
     status_code=status.HTTP_201_CREATED,
     summary="Create a new datasource",
     description="Create a new datasource connection for database queries",
+    openapi_extra=CreateBody.openapi_extra,
 )
 @transactional
 async def create_datasource(
-    data: DataSourceCreate,
+    data: DataSourceCreate = Depends(CreateBody),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[DataSourceResponse]:
     """
@@ -89,7 +114,7 @@ async def list_datasources(
     ),
     type: Optional[str] = Query(None, description="Filter by datasource type"),
     status: Optional[str] = Query(None, description="Filter by datasource status"),
-) -> StandardResponse[DataSourceListResponse]:
+) -> Response:
     """
     List all datasources with optional filtering and pagination.
 
@@ -109,11 +134,14 @@ async def list_datasources(
         skip=skip, limit=limit, type_filter=type, status_filter=status
     )
 
-    return StandardResponse(
+    body = StandardResponse[DataSourceListResponse](
         status="success",
         message="Datasources retrieved successfully",
         data=DataSourceListResponse(items=datasources, total=total),
     )
+    return Response(
+        content=_LIST_RESPONSE_ADAPTER.dump_json(body), media_type="application/json"
+    )
 
 
 @router.get(
@@ -169,10 +197,11 @@ async def get_datasource(
     response_model=StandardResponse[DataSourceResponse],
     summary="Update a datasource",
     description="Update an existing datasource's properties",
+    openapi_extra=UpdateBody.openapi_extra,
 )
 @transactional
 async def update_datasource(
-    data: DataSourceUpdate,
+    data: DataSourceUpdate = Depends(UpdateBody),
     datasource_id: uuid.UUID = Path(
         ..., description="The ID of the datasource to update"
     ),
@@ -237,9 +266,10 @@ async def delete_datasource(
     response_model=StandardResponse[DataSourceTestResponse],
     summary="Test datasource connection",
     description="Test connection to a database without creating a datasource",
+    openapi_extra=TestConnectionBody.openapi_extra,
 )
 async def test_connection(
-    data: DataSourceTestConnection,
+    data: DataSourceTestConnection = Depends(TestConnectionBody),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
 ) -> StandardResponse[DataSourceTestResponse]:
     """
@@ -268,15 +298,16 @@ async def test_connection(
     response_model=StandardResponse[Union[QueryResult, QueryError]],
     summary="Execute a query",
     description="Execute an SQL query against a datasource",
+    openapi_extra=QueryBody.openapi_extra,
 )
 @transactional
 async def execute_query(
-    query: QueryRequest,
+    query: QueryRequest = Depends(QueryBody),
     datasource_id: uuid.UUID = Path(
         ..., description="The ID of the datasource to query"
     ),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
-) -> StandardResponse[Union[QueryResult, QueryError]]:
+) -> Response:
     """
     Execute an SQL query against a datasource.
 
@@ -300,7 +331,17 @@ async def execute_query(
         parameters=query.parameters,
     )
 
-    return StandardResponse(status="success", message="Query executed", data=result)
+    # Rows come straight from the driver, so skip validating every cell:
+    # construct without validation and serialize the envelope in one pass.
+    # Warnings are off because constructed fields keep their raw types
+    # (query_id as str, columns as dicts), which serialize the same way.
+    body = StandardResponse[QueryResult].model_construct(
+        status="success", message="Query executed", data=QueryResult.model_construct(**result)
+    )
+    return Response(
+        content=_QUERY_RESULT_ADAPTER.dump_json(body, warnings=False),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -313,7 +354,7 @@ async def execute_query(
 async def get_schema(
     datasource_id: uuid.UUID = Path(..., description="The ID of the datasource"),
     repo: DatasourceRepository = Depends(DatasourceRepoDep),
-) -> StandardResponse[SchemaMetadata]:
+) -> Response:
     """
     Retrieve database schema information from a datasource.
 
@@ -330,9 +371,12 @@ async def get_schema(
     datasource_service = DatasourceService(repo=repo)
     schema = await datasource_service.get_schema_metadata(datasource_id)
 
-    return StandardResponse(
+    body = StandardResponse[SchemaMetadata](
         status="success", message="Schema retrieved successfully", data=schema
     )
+    return Response(
+        content=_SCHEMA_METADATA_ADAPTER.dump_json(body), media_type="application/json"
+    )
 
 
 @router.get(
@@ -90,9 +90,8 @@ class MDLProjectRepository:
 
     def update(self, project_id: UUID, **kwargs) -> Optional[MDLProject]:
         """Update project fields"""
-        entity = self.session.query(MDLProjectEntity).filter(
-            MDLProjectEntity.id == project_id
-        ).first()
+        stmt = select(MDLProjectEntity).where(MDLProjectEntity.id == project_id)
+        entity = self.session.execute(stmt).scalar_one_or_none()
         if not entity:
             return None
 
@@ -107,9 +106,8 @@ class MDLProjectRepository:
 
     def delete(self, project_id: UUID) -> bool:
         """Delete a project"""
-        entity = self.session.query(MDLProjectEntity).filter(
-            MDLProjectEntity.id == project_id
-        ).first()
+        stmt = select(MDLProjectEntity).where(MDLProjectEntity.id == project_id)
+        entity = self.session.execute(stmt).scalar_one_or_none()
         if not entity:
             return False
 
@@ -191,7 +189,7 @@ class AsyncMDLProjectRepository:
         """Update project fields"""
         stmt = select(MDLProjectEntity).where(MDLProjectEntity.id == project_id)
         result = await self.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
         if not entity:
             return None
 
@@ -208,7 +206,7 @@ class AsyncMDLProjectRepository:
         """Delete a project"""
         stmt = select(MDLProjectEntity).where(MDLProjectEntity.id == project_id)
         result = await self.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
         if not entity:
             return False
 
@@ -261,9 +259,8 @@ class MDLModelRepository:
 
     def update(self, model_id: UUID, **kwargs) -> Optional[MDLModel]:
         """Update model fields"""
-        entity = self.session.query(MDLModelEntity).filter(
-            MDLModelEntity.id == model_id
-        ).first()
+        stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
+        entity = self.session.execute(stmt).scalar_one_or_none()
         if not entity:
             return None
 
@@ -291,9 +288,8 @@ class MDLModelRepository:
 
     def delete(self, model_id: UUID) -> bool:
         """Delete a model"""
-        entity = self.session.query(MDLModelEntity).filter(
-            MDLModelEntity.id == model_id
-        ).first()
+        stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
+        entity = self.session.execute(stmt).scalar_one_or_none()
         if not entity:
             return False
 
@@ -351,7 +347,7 @@ class AsyncMDLModelRepository:
         """Update model fields"""
         stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
         result = await self.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
         if not entity:
             return None
 
@@ -384,7 +380,7 @@ class AsyncMDLModelRepository:
         """Delete a model"""
         stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
         result = await self.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
         if not entity:
             return False
 
@@ -174,7 +174,7 @@ class MDLService:
 
         stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
         result = await self.model_repo.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
 
         return MDLModelDetailDTO(
             id=entity.id,
@@ -295,7 +295,7 @@ class MDLService:
 
         stmt = select(MDLModelEntity).where(MDLModelEntity.id == model_id)
         result = await self.model_repo.session.execute(stmt)
-        entity = result.scalars().first()
+        entity = result.scalar_one_or_none()
 
         return MDLModelDetailDTO(
             id=entity.id,
@@ -67,6 +67,10 @@ async def startup_event():
         # Initialize default datasource
         from chatbi.domain.datasource.init_default import init_default_datasource
         await init_default_datasource()
+
+        # Pre-warm the dashboard KPI cache so the first visitor gets a cached payload
+        from chatbi.domain.dashboard.service import schedule_loan_kpi_refresh
+        schedule_loan_kpi_refresh()
         
     except Exception as e:
         logger.critical(f"Failed to initialize application: {e}")
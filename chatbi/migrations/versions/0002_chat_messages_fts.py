@@ -0,0 +1,31 @@
+"""Add full-text search index on chat message content
+
+Revision ID: 0002_chat_messages_fts
+Revises: 0001_initial_schema
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_chat_messages_fts'
+down_revision: Union[str, None] = '0001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GIN index backing ChatRepository.search_chat_messages word lookups.
+    # The expression must match the one built in the repository exactly
+    # (including the regconfig cast) for the planner to use it.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_chat_messages_content_fts "
+        "ON chat_messages USING gin (to_tsvector('simple'::regconfig, content))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_chat_messages_content_fts")
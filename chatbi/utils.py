@@ -2,11 +2,17 @@ import base64
 import decimal
 import os
 import time
+from collections.abc import Iterator
 
 import orjson
 import pandas as pd
 from pandas.core.dtypes.common import is_datetime64_any_dtype
 
+# Media type for Apache Arrow IPC stream payloads
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+# Media type for newline-delimited JSON streams
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
 
 def to_json(df: pd.DataFrame) -> dict:
     for column in df.columns:
@@ -97,3 +103,57 @@ def obj_to_base64(obj: dict) -> str:
     # Serialize the dictionary to a JSON-formatted byte string
     # Encode the byte string to a base64 string
     return base64.b64encode(orjson.dumps(obj)).decode("utf-8")
+
+
+def rows_to_arrow_ipc(rows: list[dict], metadata: dict[str, str] | None = None) -> bytes:
+    """Encode query result rows as an Apache Arrow IPC stream.
+
+    The rows are laid out column by column, so clients that understand Arrow
+    can read the result without parsing a JSON object per row.
+
+    Args:
+        rows (list[dict]): Result rows sharing the same columns.
+        metadata (dict[str, str] | None): Optional key/value pairs stored in the schema metadata.
+
+    Returns:
+        bytes: The Arrow IPC stream containing a single record batch.
+    """
+    # pyarrow is only needed by clients that negotiate Arrow responses
+    import pyarrow as pa
+
+    table = pa.Table.from_pylist(rows)
+    if metadata:
+        table = table.replace_schema_metadata(metadata)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _ndjson_default(obj):
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    raise TypeError
+
+
+def iter_rows_as_ndjson(rows: list[dict], header: dict | None = None) -> Iterator[bytes]:
+    """Yield query result rows as newline-delimited JSON.
+
+    Each row is encoded on its own, so the response can be streamed without
+    building the whole JSON document in memory first. Rows are taken as the
+    driver returned them; Decimal values are written as numbers, the same as
+    in the buffered JSON response.
+
+    Args:
+        rows (list[dict]): Result rows to encode.
+        header (dict | None): Optional object emitted as the first line, before any row.
+
+    Yields:
+        bytes: One JSON document followed by a newline.
+    """
+    if header is not None:
+        yield orjson.dumps(header, option=orjson.OPT_APPEND_NEWLINE)
+    option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+    for row in rows:
+        yield orjson.dumps(row, default=_ndjson_default, option=option)
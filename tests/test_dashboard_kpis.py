@@ -0,0 +1,91 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+import chatbi.domain  # noqa: F401  (resolve the domain import cycle first)
+from chatbi.domain.dashboard import service as dashboard_service
+from chatbi.domain.dashboard.service import DashboardService
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture(autouse=True)
+def clear_kpi_state():
+    DashboardService._kpi_cache.clear()
+    DashboardService._kpi_inflight.clear()
+    yield
+    DashboardService._kpi_cache.clear()
+    DashboardService._kpi_inflight.clear()
+
+
+@pytest.mark.anyio
+async def test_concurrent_get_loan_kpis_share_one_computation():
+    sessions_opened = []
+    release = asyncio.Event()
+    computed_with = []
+
+    @asynccontextmanager
+    async def fake_session():
+        session = object()
+        sessions_opened.append(session)
+        yield session
+
+    async def fake_compute(self, datasource_id):
+        computed_with.append(self.datasource_repo.db)
+        await release.wait()
+        return {"datasource_id": "ds-1", "summary": "ok"}
+
+    request_repo = Mock()
+    with (
+        patch.object(dashboard_service, "get_async_session", fake_session),
+        patch.object(DashboardService, "_compute_loan_kpis", fake_compute),
+    ):
+        callers = [
+            asyncio.create_task(DashboardService(request_repo).get_loan_kpis("ds-1"))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        # A later call is answered from the cache without computing again
+        cached = await DashboardService(request_repo).get_loan_kpis("ds-1")
+
+    assert len(computed_with) == 1
+    # The shared computation ran on its own session, not on a request's
+    assert computed_with == sessions_opened
+    assert request_repo.mock_calls == []
+    assert all(result is results[0] for result in results)
+    assert cached is results[0]
+    assert DashboardService._kpi_inflight == {}
+
+
+@pytest.mark.anyio
+async def test_cancelled_caller_does_not_cancel_shared_computation():
+    release = asyncio.Event()
+
+    @asynccontextmanager
+    async def fake_session():
+        yield object()
+
+    async def fake_compute(self, datasource_id):
+        await release.wait()
+        return {"datasource_id": "ds-1"}
+
+    with (
+        patch.object(dashboard_service, "get_async_session", fake_session),
+        patch.object(DashboardService, "_compute_loan_kpis", fake_compute),
+    ):
+        leaving = asyncio.create_task(DashboardService(Mock()).get_loan_kpis("ds-1"))
+        staying = asyncio.create_task(DashboardService(Mock()).get_loan_kpis("ds-1"))
+        await asyncio.sleep(0)
+        leaving.cancel()
+        release.set()
+
+        assert await staying == {"datasource_id": "ds-1"}
+        assert leaving.cancelled()
@@ -0,0 +1,135 @@
+import sqlite3
+
+import pytest
+import sqlglot
+from sqlglot import exp
+
+from chatbi.domain.dashboard.indicator_catalog import INDICATOR_DEFINITIONS
+from chatbi.domain.dashboard.metric_engine import MetricEngine, MetricFilters
+
+FILTER_SETS = [
+    {},
+    {"start_date": "2024-01-01", "end_date": "2024-03-31"},
+    {"channels": ["app", "web"], "customer_segments": ["new"]},
+    {"customer_groups": ["vip"], "loan_product": "consumer"},
+    {
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-31",
+        "channels": ["o'brien"],
+        "customer_segments": ["new", "repeat"],
+        "customer_groups": ["vip"],
+        "loan_product": "business",
+    },
+]
+
+
+def _quote(val):
+    return "'" + str(val).replace("'", "''") + "'"
+
+
+def _reference_sql(metric_key, filters):
+    """SQL as MetricEngine.build_sql rendered it before the caching changes."""
+    clauses = []
+    if filters.get("start_date"):
+        clauses.append(f"biz_date >= {_quote(filters['start_date'])}")
+    if filters.get("end_date"):
+        clauses.append(f"biz_date <= {_quote(filters['end_date'])}")
+    if filters.get("channels"):
+        clauses.append(f"channel IN ({','.join(_quote(x) for x in filters['channels'])})")
+    if filters.get("customer_segments"):
+        vals = ",".join(_quote(x) for x in filters["customer_segments"])
+        clauses.append(f"customer_segment IN ({vals})")
+    if filters.get("customer_groups"):
+        vals = ",".join(_quote(x) for x in filters["customer_groups"])
+        clauses.append(f"customer_group IN ({vals})")
+    if filters.get("loan_product"):
+        clauses.append(f"loan_type = {_quote(filters['loan_product'])}")
+    suffix = " AND " + " AND ".join(clauses) if clauses else ""
+    template = next(
+        x["sql_template"] for x in INDICATOR_DEFINITIONS if x["metric_key"] == metric_key
+    )
+    return template.replace(";", f"{suffix};")
+
+
+@pytest.mark.parametrize("filters", FILTER_SETS)
+def test_build_sql_matches_reference(filters):
+    engine = MetricEngine()
+    for item in INDICATOR_DEFINITIONS:
+        key = item["metric_key"]
+        assert engine.build_sql(key, MetricFilters(**filters)) == _reference_sql(key, filters)
+
+
+def test_build_sql_renders_filters():
+    sql = MetricEngine().build_sql(
+        "bl_active_bdm",
+        MetricFilters(start_date="2024-01-01", channels=["app", "o'brien"]),
+    )
+    assert sql == (
+        "SELECT COUNT(DISTINCT CASE WHEN bdm_active=1 THEN bdm_id END) AS metric_value "
+        "FROM loan_funnel_daily WHERE loan_type = 'business' AND 1=1"
+        " AND biz_date >= '2024-01-01' AND channel IN ('app','o''brien');"
+    )
+
+
+def test_build_sql_repeat_calls_are_stable():
+    engine = MetricEngine()
+    first = engine.build_sql("bl_active_bdm", MetricFilters(channels=["app"]))
+    assert engine.build_sql("bl_active_bdm", MetricFilters(channels=("app",))) == first
+
+
+def test_build_sql_unknown_metric():
+    with pytest.raises(ValueError, match="Metric not found"):
+        MetricEngine().build_sql("no_such_metric", MetricFilters())
+
+
+def _loan_funnel_db():
+    # Columns are untyped so SQLite accepts every catalog template as written
+    columns = {"biz_date", "channel", "customer_segment", "customer_group"}
+    for item in INDICATOR_DEFINITIONS:
+        tree = sqlglot.parse_one(item["sql_template"])
+        columns |= {column.name for column in tree.find_all(exp.Column)}
+    columns = sorted(columns)
+    conn = sqlite3.connect(":memory:")
+    conn.execute(f"CREATE TABLE loan_funnel_daily ({', '.join(columns)})")
+    rows = [
+        {col: (idx * 7 + pos) % 5 for pos, col in enumerate(columns)}
+        | {
+            "biz_date": f"2024-01-{idx + 1:02d}",
+            "channel": ("app", "web")[idx % 2],
+            "customer_segment": ("new", "repeat")[idx % 2],
+            "customer_group": "vip",
+            "loan_type": ("business", "consumer")[idx % 2],
+        }
+        for idx in range(6)
+    ]
+    conn.executemany(
+        f"INSERT INTO loan_funnel_daily ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})",
+        [[row[col] for col in columns] for row in rows],
+    )
+    return conn
+
+
+def test_build_batch_sql_wraps_reference_sql():
+    keys = ["bl_active_bdm", INDICATOR_DEFINITIONS[-1]["metric_key"]]
+    filters = {"channels": ["app"], "loan_product": "business"}
+    expected = " UNION ALL ".join(
+        f"SELECT '{key}' AS metric_key, "
+        f"({_reference_sql(key, filters).rstrip(';')}) AS metric_value"
+        for key in keys
+    )
+    assert MetricEngine().build_batch_sql(keys, MetricFilters(**filters)) == f"{expected};"
+
+
+@pytest.mark.parametrize("filters", FILTER_SETS)
+def test_build_batch_sql_returns_per_metric_values(filters):
+    conn = _loan_funnel_db()
+    engine = MetricEngine()
+    keys = [item["metric_key"] for item in INDICATOR_DEFINITIONS]
+
+    batch = dict(conn.execute(engine.build_batch_sql(keys, MetricFilters(**filters))))
+
+    assert list(batch) == keys
+    for key in keys:
+        (single,) = conn.execute(_reference_sql(key, filters)).fetchone()
+        assert batch[key] == single
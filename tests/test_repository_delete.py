@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
+
+import chatbi.domain  # noqa: F401  (resolve the domain import cycle first)
+from chatbi.domain.chat.entities import ChatSession
+from chatbi.domain.common.repository import BaseRepository
+from chatbi.domain.datasource.entities import Datasource, QueryHistory
+from chatbi.domain.datasource.repository import DatasourceRepository
+
+
+class QueryHistoryRepository(BaseRepository[QueryHistory]):
+    model_class = QueryHistory
+
+
+@pytest.fixture
+def anyio_backend():
+    return 'asyncio'
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, _record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    for model in (Datasource, QueryHistory, ChatSession):
+        model.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _datasource_with_history(session):
+    datasource = Datasource(name="sales", type="postgres", connection_info={})
+    session.add(datasource)
+    session.flush()
+    session.add(
+        QueryHistory(
+            datasource_id=datasource.id, sql="SELECT 1", execution_time_ms=1, row_count=1
+        )
+    )
+    session.flush()
+    return datasource
+
+
+@pytest.mark.anyio
+async def test_delete_datasource_cascades_to_query_history(session):
+    datasource = _datasource_with_history(session)
+
+    assert await DatasourceRepository(session).delete(datasource.id) is True
+
+    session.flush()
+    assert session.execute(select(Datasource)).scalars().all() == []
+    assert session.execute(select(QueryHistory)).scalars().all() == []
+
+
+@pytest.mark.anyio
+async def test_delete_without_cascade_drops_instance_from_session(session):
+    datasource = _datasource_with_history(session)
+    history = datasource.queries[0]
+
+    assert await QueryHistoryRepository(session).delete(history.id) is True
+
+    assert history not in session
+    assert session.execute(select(QueryHistory)).scalars().all() == []
+
+
+@pytest.mark.anyio
+async def test_delete_missing_row_returns_false(session):
+    assert await DatasourceRepository(session).delete("missing") is False
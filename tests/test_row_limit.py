@@ -0,0 +1,71 @@
+import chatbi.domain  # noqa: F401  (resolve the domain import cycle first)
+from chatbi.domain.chat.service import _apply_row_limit
+
+
+def test_appends_limit_to_plain_select():
+    assert _apply_row_limit("SELECT a FROM t", 100, "postgres") == "SELECT a FROM t LIMIT 100"
+
+
+def test_keeps_trailing_semicolon():
+    assert _apply_row_limit("SELECT a FROM t;", 100, "postgres") == "SELECT a FROM t LIMIT 100;"
+
+
+def test_preserves_comments_and_formatting():
+    sql = "-- top customers\nSELECT a,\n       b  -- the b column\nFROM t -- trailing"
+    assert _apply_row_limit(sql, 10, "postgres") == (
+        "-- top customers\nSELECT a,\n       b  -- the b column\nFROM t LIMIT 10 -- trailing"
+    )
+
+
+def test_limit_goes_after_quoted_literal():
+    sql = "SELECT a FROM t WHERE name = 'no limit'"
+    assert _apply_row_limit(sql, 5, "mysql") == f"{sql} LIMIT 5"
+
+
+def test_multi_statement_input_is_unchanged():
+    sql = "SELECT 1; SELECT 2"
+    assert _apply_row_limit(sql, 100, "postgres") == sql
+
+
+def test_existing_limit_is_kept():
+    sql = "SELECT a FROM t UNION SELECT b FROM u LIMIT 3"
+    assert _apply_row_limit(sql, 100, "postgres") == sql
+
+
+def test_existing_fetch_is_kept():
+    sql = "SELECT a FROM t FETCH FIRST 5 ROWS ONLY"
+    assert _apply_row_limit(sql, 100, "postgres") == sql
+
+
+def test_limit_in_subquery_does_not_suppress_outer_limit():
+    sql = "WITH x AS (SELECT a FROM t LIMIT 2) SELECT * FROM x"
+    assert _apply_row_limit(sql, 100, "postgres") == f"{sql} LIMIT 100"
+
+
+def test_non_query_statement_is_unchanged():
+    sql = "SHOW TABLES"
+    assert _apply_row_limit(sql, 100, "mysql") == sql
+
+
+def test_unparseable_sql_is_unchanged():
+    sql = "SELECT FROM WHERE ((("
+    assert _apply_row_limit(sql, 100, "postgres") == sql
+
+
+def test_tsql_gets_top():
+    assert _apply_row_limit("SELECT a FROM t", 100, "tsql") == "SELECT TOP 100 a FROM t"
+    assert _apply_row_limit("SELECT DISTINCT a FROM t", 100, "tsql") == (
+        "SELECT DISTINCT TOP 100 a FROM t"
+    )
+
+
+def test_tsql_top_goes_on_outermost_select():
+    sql = "WITH x AS (SELECT a FROM t) SELECT * FROM x"
+    assert _apply_row_limit(sql, 100, "tsql") == (
+        "WITH x AS (SELECT a FROM t) SELECT TOP 100 * FROM x"
+    )
+
+
+def test_tsql_existing_top_is_kept():
+    sql = "SELECT TOP 5 a FROM t"
+    assert _apply_row_limit(sql, 100, "tsql") == sql